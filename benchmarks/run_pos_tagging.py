@@ -38,6 +38,13 @@ def benchmark():
 
     results["all_hkcancor_utts"] = bench(tag_all, n=3)
 
+    # 3. All utterances from hkcancor, tagged in batches
+    # (pos_tag_many() is not available in the v3.4.0 baseline.)
+    if hasattr(pycantonese, "pos_tag_many"):
+        results["all_hkcancor_utts_batched"] = bench(
+            lambda: pycantonese.pos_tag_many(all_word_lists), n=3
+        )
+
     return results
 
 
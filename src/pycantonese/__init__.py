@@ -1,17 +1,82 @@
-from importlib.metadata import version
-
-from pycantonese.corpus import cantomap, hkcancor, read_chat, CHAT
-from pycantonese.jyutping.characters import characters_to_jyutping
-from pycantonese.jyutping.parse_jyutping import parse_jyutping
-from pycantonese.jyutping.ipa import jyutping_to_ipa
-from pycantonese.jyutping.tipa import jyutping_to_tipa
-from pycantonese.jyutping.yale import jyutping_to_yale
-from pycantonese.pos_tagging.tagger import pos_tag
+import importlib
+
+# Imported eagerly (it's small and has no dependencies), as otherwise
+# importing the submodule pycantonese.stop_words before accessing the function
+# would leave the submodule as the package attribute.
 from pycantonese.stop_words import stop_words
-from pycantonese.word_segmentation import segment
-from pycantonese.parsing import parse_text
 
-__version__ = version("pycantonese")
+# Not typing.TYPE_CHECKING, as importing typing takes longer than the rest
+# of `import pycantonese`. Type checkers treat this name the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pycantonese.corpus import cantomap, hkcancor, read_chat, CHAT
+    from pycantonese.jyutping.characters import (
+        characters_to_jyutping,
+        characters_to_jyutping_many,
+        jyutping_to_characters,
+    )
+    from pycantonese.jyutping.parse_jyutping import (
+        parse_jyutping,
+        parse_jyutping_many,
+    )
+    from pycantonese.jyutping.ipa import (
+        ipa_to_jyutping,
+        ipa_to_jyutping_many,
+        jyutping_to_ipa,
+    )
+    from pycantonese.jyutping.tipa import jyutping_to_tipa
+    from pycantonese.jyutping.yale import (
+        jyutping_to_yale,
+        jyutping_to_yale_many,
+        yale_to_jyutping,
+        yale_to_jyutping_many,
+    )
+    from pycantonese.pos_tagging.tagger import pos_tag, pos_tag_many
+    from pycantonese.word_segmentation import segment, segment_many
+    from pycantonese.parsing import parse_text
+
+    __version__: str
+
+# The public names are imported from their modules on first access (PEP 562),
+# so that `import pycantonese` doesn't load the corpus reader, the models,
+# or the parsing machinery when only, say, the Jyutping converters are used.
+_LAZY_ATTRIBUTES = {
+    "cantomap": "pycantonese.corpus",
+    "hkcancor": "pycantonese.corpus",
+    "read_chat": "pycantonese.corpus",
+    "CHAT": "pycantonese.corpus",
+    "characters_to_jyutping": "pycantonese.jyutping.characters",
+    "characters_to_jyutping_many": "pycantonese.jyutping.characters",
+    "jyutping_to_characters": "pycantonese.jyutping.characters",
+    "parse_jyutping": "pycantonese.jyutping.parse_jyutping",
+    "parse_jyutping_many": "pycantonese.jyutping.parse_jyutping",
+    "jyutping_to_ipa": "pycantonese.jyutping.ipa",
+    "ipa_to_jyutping": "pycantonese.jyutping.ipa",
+    "ipa_to_jyutping_many": "pycantonese.jyutping.ipa",
+    "jyutping_to_tipa": "pycantonese.jyutping.tipa",
+    "jyutping_to_yale": "pycantonese.jyutping.yale",
+    "jyutping_to_yale_many": "pycantonese.jyutping.yale",
+    "yale_to_jyutping": "pycantonese.jyutping.yale",
+    "yale_to_jyutping_many": "pycantonese.jyutping.yale",
+    "pos_tag": "pycantonese.pos_tagging.tagger",
+    "pos_tag_many": "pycantonese.pos_tagging.tagger",
+    "segment": "pycantonese.word_segmentation",
+    "segment_many": "pycantonese.word_segmentation",
+    "parse_text": "pycantonese.parsing",
+}
+
+# Subpackages and modules were available as attributes after `import pycantonese`
+# when the public names were imported eagerly, so they still are.
+_SUBMODULES = {
+    "corpus",
+    "data",
+    "jyutping",
+    "parsing",
+    "pos_tagging",
+    "search",
+    "util",
+    "word_segmentation",
+}
 
 __all__ = [
     "__version__",
@@ -19,13 +84,46 @@ __all__ = [
     "cantomap",
     "CHAT",
     "characters_to_jyutping",
+    "characters_to_jyutping_many",
     "hkcancor",
+    "ipa_to_jyutping",
+    "ipa_to_jyutping_many",
+    "jyutping_to_characters",
     "jyutping_to_ipa",
     "jyutping_to_tipa",
     "jyutping_to_yale",
+    "jyutping_to_yale_many",
     "parse_jyutping",
+    "parse_jyutping_many",
     "pos_tag",
+    "pos_tag_many",
     "read_chat",
     "stop_words",
     "segment",
+    "segment_many",
+    "yale_to_jyutping",
+    "yale_to_jyutping_many",
 ]
+
+
+def __getattr__(name):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("pycantonese")
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
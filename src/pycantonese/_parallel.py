@@ -0,0 +1,98 @@
+"""Process pools with the models preloaded, for the functions with parallelism."""
+
+from __future__ import annotations
+
+import concurrent.futures as cf
+import gc
+import multiprocessing as mp
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_IS_WASM = sys.platform == "emscripten"
+
+# Fork the workers only on Linux, where it's safe (unlike on macOS)
+# and lets them share the models loaded in this process.
+_CAN_FORK = sys.platform == "linux" and "fork" in mp.get_all_start_methods()
+
+
+def _get_n_workers(n_jobs: int | None) -> int:
+    """Resolve the ``n_jobs`` argument into the number of worker processes."""
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1: {n_jobs}")
+    return n_jobs
+
+
+def _map_chunk(func: Callable[[Any], _T], chunk: list) -> list[_T]:
+    return [func(item) for item in chunk]
+
+
+def _parallel_imap(
+    func: Callable[[Any], _T],
+    data: Iterable,
+    *,
+    initializer: Callable[..., None],
+    initargs: tuple = (),
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[_T]:
+    """Yield *func* of each item of *data* from a process pool, in order.
+
+    ``initializer(*initargs)`` loads the models that *func* needs and sets up
+    any other state of the workers. It must be a module-level function, with
+    picklable *initargs*, and calling it again must have no further effect.
+
+    Where fork is available, *initializer* runs once in this process, and the
+    workers inherit the loaded models, sharing the memory pages (copy-on-write)
+    instead of each loading its own copy. Elsewhere, *initializer* runs in each
+    worker when it starts, rather than the models being loaded lazily during
+    the first task.
+
+    The items are sent to the workers *chunksize* at a time, and only a few
+    chunks per worker are in flight, so that memory stays flat however many
+    items *data* has.
+    """
+    if _CAN_FORK:
+        initializer(*initargs)
+        executor = cf.ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp.get_context("fork")
+        )
+    else:
+        executor = cf.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    data = iter(data)
+    with executor:
+        futures: deque[cf.Future] = deque()
+        # Keep the garbage collector in the workers from touching (and therefore
+        # copying) the pages of the inherited objects. The workers are forked
+        # when the first chunk is submitted.
+        frozen = _CAN_FORK
+        if frozen:
+            gc.freeze()
+        try:
+            while chunk := list(islice(data, chunksize)):
+                futures.append(executor.submit(_map_chunk, func, chunk))
+                if frozen:
+                    gc.unfreeze()
+                    frozen = False
+                if len(futures) > max_pending:
+                    yield from futures.popleft().result()
+        finally:
+            if frozen:
+                gc.unfreeze()
+        while futures:
+            yield from futures.popleft().result()
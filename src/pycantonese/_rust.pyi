@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from rustling.chat import Headers
@@ -125,6 +126,14 @@ class Chat:
     def from_utterances(cls, utterances: list[Utterance]) -> Chat: ...
     def tokens(self, *, by_utterance: bool = False, by_file: bool = False) -> Any: ...
     def jyutping(self, *, by_utterance: bool = False, by_file: bool = False) -> Any: ...
+    def romanization(
+        self,
+        scheme: str,
+        converter: Callable[[list[str]], list[str | None]],
+        *,
+        by_utterance: bool = False,
+        by_file: bool = False,
+    ) -> Any: ...
     def utterances(self, *, by_file: bool = False) -> Any: ...
     def words(self, *, by_utterance: bool = False, by_file: bool = False) -> Any: ...
     @property
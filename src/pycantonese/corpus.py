@@ -9,6 +9,9 @@ from collections.abc import Sequence
 from typing import cast
 
 from pycantonese._rust import Chat as _RustChat, Token, Utterance
+from pycantonese.jyutping.ipa import jyutping_to_ipa
+from pycantonese.jyutping.tipa import jyutping_to_tipa
+from pycantonese.jyutping.yale import jyutping_to_yale
 from pycantonese.search import _perform_search
 
 _IS_WASM = sys.platform == "emscripten"
@@ -19,6 +22,37 @@ def _flatten(iterable):
     return list(itertools.chain.from_iterable(iterable))
 
 
+def _jyutping_to_yale_string(jp_str: str) -> str:
+    return jyutping_to_yale(jp_str, return_as="string")
+
+
+def _jyutping_to_ipa_string(jp_str: str) -> str:
+    return jyutping_to_ipa(jp_str, return_as="string")
+
+
+def _jyutping_to_tipa_string(jp_str: str) -> str:
+    return " ".join(jyutping_to_tipa(jp_str))
+
+
+_ROMANIZATIONS = {
+    "yale": _jyutping_to_yale_string,
+    "ipa": _jyutping_to_ipa_string,
+    "tipa": _jyutping_to_tipa_string,
+}
+
+
+def _romanize(convert, jp_strs: list[str]) -> list[str | None]:
+    """Convert Jyutping strings, with None for those that can't be converted."""
+    result = []
+    for jp_str in jp_strs:
+        try:
+            result.append(convert(jp_str))
+        except (ValueError, KeyError):
+            # KeyError for a Jyutping sound without a symbol in the scheme.
+            result.append(None)
+    return result
+
+
 class CHAT:
     """A reader for Cantonese CHAT corpus data.
 
@@ -381,6 +415,56 @@ class CHAT:
         """
         return self._chat.jyutping(by_utterance=by_utterance, by_file=by_file)
 
+    def romanization(
+        self,
+        scheme: str,
+        *,
+        by_utterance=False,
+        by_file=False,
+    ) -> list[str | None] | list[list[str | None]] | list[list[list[str | None]]]:
+        """Return the data in Yale romanization, IPA, or TIPA.
+
+        The Jyutping romanization of the tokens
+        (see :func:`~pycantonese.CHAT.jyutping`)
+        is converted with :func:`~pycantonese.jyutping_to_yale`
+        (with ``return_as="string"``), :func:`~pycantonese.jyutping_to_ipa`
+        (with ``return_as="string"``), or :func:`~pycantonese.jyutping_to_tipa`
+        (with the syllables joined by spaces).
+        Each distinct Jyutping string is converted once, and the result is
+        cached until the data of this reader changes
+        (e.g., with :func:`~pycantonese.CHAT.append`
+        or :func:`~pycantonese.CHAT.extend`).
+        Tokens without Jyutping, or with Jyutping that can't be converted,
+        have ``None``.
+
+        .. versionadded:: 4.3.0
+
+        Args:
+            scheme (str): One of ``"yale"``, ``"ipa"``, and ``"tipa"``.
+            by_utterance (bool, optional): If True, return the romanization
+                grouped by utterance.
+            by_file (bool, optional): If True, return the romanization grouped
+                by file.
+
+        Returns:
+            list
+
+        Raises:
+            ValueError: If *scheme* isn't one of the supported schemes.
+        """
+        try:
+            convert = _ROMANIZATIONS[scheme]
+        except KeyError:
+            raise ValueError(
+                f"scheme must be one of {sorted(_ROMANIZATIONS)}: {scheme!r}"
+            ) from None
+        return self._chat.romanization(
+            scheme,
+            functools.partial(_romanize, convert),
+            by_utterance=by_utterance,
+            by_file=by_file,
+        )
+
     @staticmethod
     def _get_chars_from_sent(sent: list[str]) -> list[str]:
         result = []
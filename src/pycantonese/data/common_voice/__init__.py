@@ -3,5 +3,15 @@ import os
 
 _THIS_DIR = os.path.abspath(os.path.dirname(__file__))
 
-with open(os.path.join(_THIS_DIR, "sents.json"), encoding="utf8") as f:
-    SENTS = json.load(f)
+SENTS: list[str]
+
+
+def __getattr__(name):
+    # The data is loaded on first access (PEP 562),
+    # so that importing this module is cheap.
+    if name != "SENTS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with open(os.path.join(_THIS_DIR, "sents.json"), encoding="utf8") as f:
+        data = json.load(f)
+    globals()[name] = data
+    return data
@@ -1,10 +1,35 @@
 import json
 import os
 
+from ._mapped_dict import _MappedDict
+
 _THIS_DIR = os.path.abspath(os.path.dirname(__file__))
 
-with open(os.path.join(_THIS_DIR, "chars_to_jyutping.json"), encoding="utf8") as f:
-    CHARS_TO_JYUTPING = json.load(f)
+# The data is loaded from the files on first access (PEP 562),
+# so that importing this module is cheap.
+_DATA_FILENAMES = {
+    "CHARS_TO_JYUTPING": "chars_to_jyutping.bin",
+    "MIXED_SCRIPT_WORDS": "mixed_script_words.json",
+    "PHRASE_FRAGMENTS": "phrase_fragments.json",
+}
+
+CHARS_TO_JYUTPING: _MappedDict
+MIXED_SCRIPT_WORDS: list[str]
+PHRASE_FRAGMENTS: list[str]
+
 
-with open(os.path.join(_THIS_DIR, "phrase_fragments.json"), encoding="utf8") as f:
-    PHRASE_FRAGMENTS: list[str] = json.load(f)
+def __getattr__(name):
+    try:
+        filename = _DATA_FILENAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    path = os.path.join(_THIS_DIR, filename)
+    if name == "CHARS_TO_JYUTPING":
+        # Memory-mapped rather than loaded into a dict,
+        # as it's much bigger than the other data.
+        data = _MappedDict(path)
+    else:
+        with open(path, encoding="utf8") as f:
+            data = json.load(f)
+    globals()[name] = data
+    return data
@@ -0,0 +1,195 @@
+"""A read-only str-to-str mapping backed by a memory-mapped file.
+
+The file is laid out as follows, with all integers as little-endian uint32:
+
+- The magic bytes ``b"PCMD"`` and the format version.
+- The number of entries *n* and the number of hash table slots *m*.
+- *2n + 1* offsets into the string data, where entry *i* has its key
+  between offsets *2i* and *2i + 1*, and its value between offsets
+  *2i + 1* and *2i + 2*.
+- *m* hash table slots, each either 0 (empty) or an entry index plus one.
+  A key goes to slot ``zlib.crc32(key) % m``, with linear probing.
+- The UTF-8 encoded keys and values.
+
+Nothing is parsed when the file is opened. The operating system pages
+the data in as the lookups touch it, and processes that open the same file
+share the pages.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import ItemsView, Iterator, Mapping, Sequence
+from zlib import crc32
+
+_MAGIC = b"PCMD"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIII")
+
+# At a load factor of 1/2, linear probing looks at about 1.5 slots on average
+# to find a key and 2.5 slots to miss one.
+_SLOTS_PER_ENTRY = 2
+
+
+def _to_uint32_array(view: memoryview) -> memoryview | array:
+    if sys.byteorder == "little":
+        return view.cast("I")
+    integers = array("I", view.tobytes())
+    integers.byteswap()
+    return integers
+
+
+def _write_mapped_dict(mapping: Mapping[str, str], path: str) -> None:
+    """Write *mapping* to *path* in the format read by :class:`_MappedDict`.
+
+    The entries keep the iteration order of *mapping*.
+    """
+    encoded = [
+        (key.encode("utf8"), value.encode("utf8")) for key, value in mapping.items()
+    ]
+    n = len(encoded)
+    m = n * _SLOTS_PER_ENTRY + 1
+
+    offsets = array("I", [0])
+    slots = array("I", bytes(4 * m))
+    for index, (key, value) in enumerate(encoded):
+        offsets.append(offsets[-1] + len(key))
+        offsets.append(offsets[-1] + len(value))
+        slot = crc32(key) % m
+        while slots[slot]:
+            slot = (slot + 1) % m
+        slots[slot] = index + 1
+
+    if sys.byteorder == "big":
+        offsets.byteswap()
+        slots.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, n, m))
+        f.write(offsets.tobytes())
+        f.write(slots.tobytes())
+        for key, value in encoded:
+            f.write(key)
+            f.write(value)
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self):
+        # Read the entries in order, instead of looking up each key.
+        return self._mapping._iter_items()
+
+
+class _SortedKeys(Sequence[str]):
+    """The keys of a :class:`_MappedDict` in sorted order, e.g., for bisect.
+
+    Only the order of the entries is kept in memory, in an array of 4 bytes
+    per entry, and the keys are read from the file as they're accessed.
+    """
+
+    def __init__(self, mapping: _MappedDict, order: array):
+        self._mapping = mapping
+        self._order = order
+
+    def __getitem__(self, index: int) -> str:
+        return self._mapping._key(self._order[index])
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class _MappedDict(Mapping[str, str]):
+    """Read-only mapping from str to str backed by a memory-mapped file.
+
+    This is a drop-in replacement for a dict loaded from the same data, but
+    only a few small arrays are created in memory. Iteration follows the order
+    of the entries in the file. Use :func:`_write_mapped_dict` to create the file.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, m = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"not a mapped dict file (version {_VERSION}): {path}")
+        view = memoryview(self._mm)
+        start = _HEADER.size
+        end = start + 4 * (2 * n + 1)
+        self._offsets = _to_uint32_array(view[start:end])
+        start, end = end, end + 4 * m
+        self._slots = _to_uint32_array(view[start:end])
+        self._data_start = end
+        self._len = n
+        self._n_slots = m
+
+    def __reduce__(self):
+        # Re-open the file instead of pickling the data, e.g., for worker processes.
+        return type(self), (self._path,)
+
+    def _find(self, key: str) -> int:
+        """Return the index of the entry for *key*, or -1 if there isn't one."""
+        if not isinstance(key, str) or not self._len:
+            return -1
+        encoded = key.encode("utf8")
+        mm, offsets, slots = self._mm, self._offsets, self._slots
+        data_start, n_slots = self._data_start, self._n_slots
+        slot = crc32(encoded) % n_slots
+        while index_plus_one := slots[slot]:
+            i = 2 * (index_plus_one - 1)
+            start = data_start + offsets[i]
+            if mm[start : data_start + offsets[i + 1]] == encoded:
+                return i
+            slot += 1
+            if slot == n_slots:
+                slot = 0
+        return -1
+
+    def _key(self, index: int) -> str:
+        """Return the key of the *index*-th entry."""
+        i = 2 * index
+        offsets, data_start = self._offsets, self._data_start
+        start = data_start + offsets[i]
+        return self._mm[start : data_start + offsets[i + 1]].decode("utf8")
+
+    def _sorted_keys(self) -> _SortedKeys:
+        """Return the keys in sorted order, without holding them in memory."""
+        order = array("I", sorted(range(self._len), key=self._key))
+        return _SortedKeys(self, order)
+
+    def __getitem__(self, key: str) -> str:
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        offsets, data_start = self._offsets, self._data_start
+        start = data_start + offsets[i + 1]
+        return self._mm[start : data_start + offsets[i + 2]].decode("utf8")
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        mm, offsets, data_start = self._mm, self._offsets, self._data_start
+        for i in range(0, 2 * self._len, 2):
+            start = data_start + offsets[i]
+            yield mm[start : data_start + offsets[i + 1]].decode("utf8")
+
+    def _iter_items(self) -> Iterator[tuple[str, str]]:
+        mm, offsets, data_start = self._mm, self._offsets, self._data_start
+        for i in range(0, 2 * self._len, 2):
+            key_start = data_start + offsets[i]
+            value_start = data_start + offsets[i + 1]
+            yield (
+                mm[key_start:value_start].decode("utf8"),
+                mm[value_start : data_start + offsets[i + 2]].decode("utf8"),
+            )
+
+    def items(self) -> ItemsView[str, str]:
+        return _ItemsView(self)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._path!r})"
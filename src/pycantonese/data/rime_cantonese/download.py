@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Download rime-cantonese data and generate chars_to_jyutping.json."""
+"""Download rime-cantonese data and generate the data files."""
 
 import csv
 import io
@@ -8,6 +8,9 @@ import os
 import shutil
 import subprocess
 
+from pycantonese.data.rime_cantonese._mapped_dict import _write_mapped_dict
+from pycantonese.util import _NOT_CANTONESE
+
 UPSTREAM_COMMIT = "bea0d7a366627506eb214d82b80780b5db4b05a1"
 UPSTREAM_REPO = "CanCLID/rime-cantonese-upstream"
 
@@ -102,6 +105,18 @@ def _process_lettered_yaml(content: str) -> dict[str, str]:
     return mapping
 
 
+def _get_mixed_script_words(chars_to_jyutping: dict[str, str]) -> list[str]:
+    """Return the words that mix alphanumeric and Cantonese characters."""
+    return sorted(
+        word
+        for word in chars_to_jyutping
+        if any(
+            (c1 in _NOT_CANTONESE) != (c2 in _NOT_CANTONESE)
+            for c1, c2 in zip(word, word[1:])
+        )
+    )
+
+
 def main() -> None:
     _check_gh()
 
@@ -132,12 +147,24 @@ def main() -> None:
     # Sort by jyutping value.
     chars_to_jyutping = dict(sorted(chars_to_jyutping.items(), key=lambda x: x[1]))
 
-    output_path = os.path.join(this_dir, "chars_to_jyutping.json")
-    with open(output_path, "w", encoding="utf8") as f:
-        json.dump(chars_to_jyutping, f, ensure_ascii=False, indent=4)
+    # A memory-mapped file instead of JSON, so that the data isn't loaded
+    # into memory (and is shared across processes).
+    output_path = os.path.join(this_dir, "chars_to_jyutping.bin")
+    _write_mapped_dict(chars_to_jyutping, output_path)
 
     print(f"Written to {output_path}")
 
+    # The mixed-script words let the word segmenter keep known words like
+    # "IQ題" intact without loading all of chars_to_jyutping.bin.
+    mixed_script_words = _get_mixed_script_words(chars_to_jyutping)
+    print(f"  {len(mixed_script_words)} mixed-script words")
+
+    mixed_script_words_path = os.path.join(this_dir, "mixed_script_words.json")
+    with open(mixed_script_words_path, "w", encoding="utf8") as f:
+        json.dump(mixed_script_words, f, ensure_ascii=False, indent=4)
+
+    print(f"Written to {mixed_script_words_path}")
+
     # Download phrase_fragment.csv separately — used only for unsupervised EM
     # training in word segmentation (not supervised boundary labeling).
     print("Downloading phrase_fragment.csv...")
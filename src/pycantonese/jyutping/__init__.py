@@ -1,3 +1,4 @@
-from pycantonese.jyutping.parse_jyutping import Jyutping
+from pycantonese.jyutping.ipa import IPAConverter
+from pycantonese.jyutping.parse_jyutping import Jyutping, JyutpingArrays
 
-__all__ = ["Jyutping"]
+__all__ = ["IPAConverter", "Jyutping", "JyutpingArrays"]
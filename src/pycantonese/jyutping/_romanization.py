@@ -0,0 +1,152 @@
+"""Shared machinery for converting between Jyutping and other romanizations.
+
+A romanization scheme (Yale, IPA, TIPA) is declared as a function that
+converts one parsed Jyutping syllable, with the scheme's symbol tables and
+rules. :func:`_compile_forward` applies the function to every well-formed
+Jyutping syllable once, so that converting a Jyutping string is a split at
+the tone digits plus a table lookup for each syllable (with
+``_look_up_syllables`` from ``parse_jyutping``). :func:`_compile_reverse`
+inverts the table, so that a string in the scheme can be split into known syllables and
+converted back into Jyutping (:func:`_to_jyutping_syllables`).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import NamedTuple, TypeVar
+
+from pycantonese.jyutping.parse_jyutping import Jyutping, _get_syllables
+
+_T = TypeVar("_T")
+
+_JYUTPING_SYLLABLE_RE = re.compile(r"[a-z]+[1-6]")
+
+
+def _compile_forward(convert: Callable[[Jyutping], _T]) -> dict[str, _T]:
+    """Return the table of all well-formed Jyutping syllables to *convert*.
+
+    Syllables that the scheme has no symbols for (where *convert* raises
+    a KeyError) are left out.
+    """
+    table = {}
+    for syllable, jp in _get_syllables().items():
+        try:
+            table[syllable] = convert(jp)
+        except KeyError:
+            continue
+    return table
+
+
+@lru_cache(maxsize=1)
+def _get_syllable_counts() -> Counter[str]:
+    """Return how many times each Jyutping syllable occurs in rime-cantonese."""
+    from pycantonese.data.rime_cantonese import CHARS_TO_JYUTPING
+
+    findall = _JYUTPING_SYLLABLE_RE.findall
+    counts = Counter()
+    for jp_str in CHARS_TO_JYUTPING.values():
+        counts.update(findall(jp_str))
+    return counts
+
+
+class _ReverseTable(NamedTuple):
+    # The forms in the scheme to their Jyutping syllables.
+    syllables: dict[str, str]
+    # The length of the longest form.
+    max_length: int
+    # The forms to log(1 + the count of their Jyutping syllables), for choosing
+    # among the ways to split a string into forms.
+    weights: dict[str, float]
+
+
+def _compile_reverse(table: dict[str, str]) -> _ReverseTable:
+    """Invert a table of Jyutping syllables to their forms in a scheme.
+
+    The forms are NFC-normalized. Where Jyutping syllables have the same form
+    (e.g., "aa1" and "a1" are both "ā" in Yale), the form goes to the syllable
+    that occurs the most in rime-cantonese, and to the first one in *table*
+    if none of them occurs.
+    """
+    candidates: dict[str, list[str]] = {}
+    for syllable, form in table.items():
+        candidates.setdefault(unicodedata.normalize("NFC", form), []).append(syllable)
+    counts = _get_syllable_counts()
+    syllables = {}
+    weights = {}
+    for form, jp_syllables in candidates.items():
+        # max() keeps the first of the syllables with the same count.
+        syllable = max(jp_syllables, key=counts.__getitem__)
+        syllables[form] = syllable
+        weights[form] = math.log1p(counts[syllable])
+    return _ReverseTable(syllables, max(map(len, syllables), default=0), weights)
+
+
+def _to_jyutping_syllables(
+    text: str,
+    reverse: _ReverseTable,
+    is_ambiguous: Callable[[str, str], bool] | None = None,
+) -> list[str] | None:
+    """Split *text* into forms in *reverse* and return their Jyutping syllables.
+
+    *text* has no separators between the syllables. Of all the ways to split
+    it into known forms, the one with the fewest boundaries where
+    *is_ambiguous* (of the forms before and after the boundary) is true
+    is chosen, then the one with the fewest syllables, then the one with
+    the most common syllables (the largest sum of weights), and then the one
+    with the longest syllables first. Return None if there's no way to split it.
+    This is a single pass over *text* from the end, where the best split of
+    each suffix extends the best split of a shorter suffix.
+    """
+    syllables, max_length, weights = reverse
+    n = len(text)
+    # best[i] is (number of ambiguous boundaries, number of syllables,
+    # negative sum of weights, end of the first form) for the best split
+    # of text[i:].
+    best: list[tuple[int, int, float, int] | None] = [None] * (n + 1)
+    best[n] = (0, 0, 0.0, n)
+    for i in range(n - 1, -1, -1):
+        for j in range(min(n, i + max_length), i, -1):
+            form = text[i:j]
+            if (rest := best[j]) is None or form not in syllables:
+                continue
+            n_ambiguous, n_syllables, negative_weight, next_end = rest
+            if j < n and is_ambiguous is not None:
+                n_ambiguous += is_ambiguous(form, text[j:next_end])
+            candidate = (
+                n_ambiguous,
+                n_syllables + 1,
+                negative_weight - weights[form],
+                j,
+            )
+            if best[i] is None or candidate[:3] < best[i][:3]:
+                best[i] = candidate
+    if best[0] is None:
+        return None
+    jp_syllables = []
+    i = 0
+    while i < n:
+        j = best[i][3]
+        jp_syllables.append(syllables[text[i:j]])
+        i = j
+    return jp_syllables
+
+
+def _convert_many(strs: Iterable[str], convert: Callable[[str], str]) -> list[str]:
+    """Convert many strings with *convert*, each distinct string once."""
+    # Dictionary and corpus data repeat the same strings a lot.
+    converted: dict[str, str] = {}
+    results = []
+    for s in strs:
+        if not isinstance(s, str):
+            # For the error, or the null value.
+            results.append(convert(s))
+        elif (result := converted.get(s)) is not None:
+            results.append(result)
+        else:
+            results.append(converted.setdefault(s, convert(s)))
+    return results
@@ -1,71 +1,135 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from functools import lru_cache
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import ChainMap
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Iterable, Iterator, NamedTuple, Sequence
 
-from ..corpus import hkcancor, Token
+from .._parallel import _IS_WASM, _get_n_workers, _parallel_imap
 from ..data.rime_cantonese import CHARS_TO_JYUTPING
-from ..jyutping.parse_jyutping import parse_jyutping
-from ..word_segmentation.segmenter import segment
+from ..data.rime_cantonese._mapped_dict import _MappedDict
+from ..jyutping.lexicon import _build_hkcancor_lexicon, _read_hkcancor_lexicon
+from ..word_segmentation.segmenter import (
+    _DEFAULT_BATCH_SIZE,
+    _get_default_segmenter,
+    _init_worker as _init_segmenter_worker,
+    _iter_batches,
+    _segment_batch,
+    segment,
+)
 
 
 @lru_cache(maxsize=1)
-def _get_words_characters_to_jyutping():
-    corpus = hkcancor()
-    words_to_jyutping_counters = defaultdict(Counter)
-    characters_to_jyutping_counters = defaultdict(Counter)
+def _get_hkcancor_lexicon():
+    try:
+        return _read_hkcancor_lexicon()
+    except FileNotFoundError:
+        # E.g., in a source checkout where the lexicon hasn't been built.
+        return _build_hkcancor_lexicon()
 
-    for token in corpus.tokens():
-        token: Token
-        word = token.word
-        jyutping = token.jyutping
 
-        if not jyutping or not word:
-            continue
-        try:
-            parsed_jp = parse_jyutping(jyutping)
-        except ValueError:
-            continue
-        if len(word) != len(parsed_jp):
-            continue
-        words_to_jyutping_counters[word][jyutping] += 1
-        for char, jp in zip(word, parsed_jp):
-            characters_to_jyutping_counters[char][str(jp)] += 1
-
-    words_to_jyutping = {}
-    for word, jyutping_counter in words_to_jyutping_counters.items():
-        jp = jyutping_counter.most_common(1)[0][0]
-        words_to_jyutping[word] = jp
-    chars_to_jp = {}
-    for character, jyutping_counter in characters_to_jyutping_counters.items():
-        jp = jyutping_counter.most_common(1)[0][0]
-        chars_to_jp[character] = jp
-
-    words_to_jyutping = {
-        # The ordering of the following dicts matters.
-        # rime-cantonese (more accurate data) overrides HKCanCor if they don't agree.
-        **words_to_jyutping,
-        **CHARS_TO_JYUTPING,
-    }
-
-    chars_to_jp = {
-        # The ordering of the following dicts matters.
-        # rime-cantonese (more accurate data) overrides HKCanCor if they don't agree.
-        **chars_to_jp,
-        **{k: v for k, v in CHARS_TO_JYUTPING.items() if len(k) == 1},
-    }
+@lru_cache(maxsize=1)
+def _get_words_characters_to_jyutping():
+    words_to_jyutping, chars_to_jp, _, _ = _get_hkcancor_lexicon()
+
+    # The ordering of the following maps matters.
+    # rime-cantonese (more accurate data) overrides HKCanCor if they don't agree.
+    # ChainMap looks up the memory-mapped rime-cantonese data in place,
+    # rather than copying it into a dict.
+    words_to_jyutping = ChainMap(CHARS_TO_JYUTPING, words_to_jyutping)
+    # Only single characters are looked up here,
+    # so the words in CHARS_TO_JYUTPING don't get in the way.
+    chars_to_jp = ChainMap(CHARS_TO_JYUTPING, chars_to_jp)
 
     return words_to_jyutping, chars_to_jp
 
 
+@lru_cache(maxsize=1)
+def _get_sorted_words() -> tuple[Sequence[str], ...]:
+    """Return the words with Jyutping from each source, in sorted order.
+
+    These are for finding the longest known word at a position without trying
+    every length, with a binary search instead of a set of all the prefixes
+    of the words. The memory-mapped rime-cantonese words stay in the file.
+    """
+    words_to_jyutping, _ = _get_words_characters_to_jyutping()
+    return tuple(
+        words._sorted_keys() if isinstance(words, _MappedDict) else sorted(words)
+        for words in words_to_jyutping.maps
+    )
+
+
+def _is_proper_prefix(prefix: str, sorted_words: tuple[Sequence[str], ...]) -> bool:
+    """Return whether *prefix* is a proper prefix of a word in *sorted_words*."""
+    for words in sorted_words:
+        # The words that start with the prefix, other than the prefix itself,
+        # come right after it in sorted order.
+        i = bisect_right(words, prefix)
+        if i < len(words) and words[i].startswith(prefix):
+            return True
+    return False
+
+
+def _longest_match_jyutping(word: str) -> str | None:
+    """Return the Jyutping of an unknown word from the longest known sub-words.
+
+    Going from left to right, each next piece of the word is the longest
+    known word there, or else a single character. If a character has no
+    Jyutping, None is returned.
+    """
+    words_to_jyutping, chars_to_jyutping = _get_words_characters_to_jyutping()
+    sorted_words = _get_sorted_words()
+    parts = []
+    i = 0
+    while i < len(word):
+        jp = chars_to_jyutping.get(word[i])
+        end = i + 1
+        # Extend the piece while it's still a prefix of a known word.
+        j = i + 1
+        while j < len(word) and _is_proper_prefix(word[i:j], sorted_words):
+            j += 1
+            longer_jp = words_to_jyutping.get(word[i:j])
+            if longer_jp is not None:
+                jp = longer_jp
+                end = j
+        if jp is None:
+            return None
+        parts.append(jp)
+        i = end
+    return "".join(parts)
+
+
+def _words_to_jyutping(words: Iterable[str]) -> list[str | None]:
+    """Return the Jyutping of each word, or None if it can't be determined."""
+    words_to_jyutping, _ = _get_words_characters_to_jyutping()
+    # Unknown words tend to recur, e.g., names in a long text.
+    unknown_words = {}
+    result = []
+    for word in words:
+        try:
+            jp = words_to_jyutping[word]
+        except KeyError:
+            try:
+                jp = unknown_words[word]
+            except KeyError:
+                jp = unknown_words[word] = _longest_match_jyutping(word)
+        result.append(jp)
+    return result
+
+
 def characters_to_jyutping(
     chars: str | list[str],
 ) -> list[tuple[str, str]]:
     """Convert Cantonese characters into Jyutping romanization.
 
     The conversion model is based on the HKCanCor corpus and rime-cantonese
-    data. Any unseen Cantonese character (or punctuation mark,
-    for that matter) is represented by `None` in the output.
+    data. A word not in the data is romanized by the longest known
+    words within it (or else character by character). A word with any unseen
+    Cantonese character (or punctuation mark, for that matter)
+    is represented by `None` in the output.
 
     Args:
         chars (str or list[str]): A string of Cantonese characters, in which
@@ -89,18 +153,201 @@ def characters_to_jyutping(
         segmented = chars
     else:
         segmented = segment(chars)
-    words_to_jyutping, chars_to_jyutping = _get_words_characters_to_jyutping()
-    result = []
-    for word in segmented:
-        try:
-            jp = words_to_jyutping[word]
-        except KeyError:
-            jp = ""
-            for char in word:
-                try:
-                    jp += chars_to_jyutping[char]
-                except KeyError:
-                    jp = None
-                    break
-        result.append((word, jp))
-    return result
+    return list(zip(segmented, _words_to_jyutping(segmented)))
+
+
+def _characters_to_jyutping_batch(
+    texts: list, presegmented: bool
+) -> list[list[tuple[str, str | None]]]:
+    """Convert a batch of inputs, with a single call to the segmentation model."""
+    if presegmented:
+        segmented = texts
+    else:
+        segmented = _segment_batch(texts, offsets=False)
+    # Look up the words of the whole batch at once,
+    # so that unknown words are resolved once per batch.
+    jyutping = iter(_words_to_jyutping(chain.from_iterable(segmented)))
+    return [[(word, next(jyutping)) for word in words] for words in segmented]
+
+
+def _init_worker(user_words: list[str]) -> None:
+    """Load the models for converting characters in a worker process."""
+    _init_segmenter_worker(user_words)
+    _get_words_characters_to_jyutping()
+
+
+def _iter_characters_to_jyutping(
+    texts: Iterable, presegmented: bool, batch_size: int, n_workers: int
+) -> Iterator[list[tuple[str, str | None]]]:
+    batches = _iter_batches(texts, batch_size)
+    if n_workers == 1 or _IS_WASM:
+        for batch in batches:
+            yield from _characters_to_jyutping_batch(batch, presegmented)
+        return
+    for converted in _parallel_imap(
+        partial(_characters_to_jyutping_batch, presegmented=presegmented),
+        batches,
+        initializer=_init_worker,
+        initargs=(list(_get_default_segmenter()._user_words),),
+        max_workers=n_workers,
+    ):
+        yield from converted
+
+
+def characters_to_jyutping_many(
+    texts: Iterable[str] | Iterable[list[str]],
+    *,
+    presegmented: bool = False,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    n_jobs: int | None = None,
+) -> Iterator[list[tuple[str, str | None]]]:
+    """Convert many inputs of Cantonese characters into Jyutping romanization.
+
+    The result for each input is the same as from
+    :func:`~pycantonese.characters_to_jyutping`, but the inputs are
+    segmented in batches with a single call to the word segmentation model
+    per batch. The results are yielded as they become available,
+    so that *texts* can be an iterator over more inputs than fit in memory.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        texts (Iterable[str] or Iterable[list[str]]): Strings of Cantonese
+            characters, or lists of words if *presegmented* is True.
+        presegmented (bool, optional): If True, each input is a list of words
+            with your desired segmentation, and word segmentation is not run.
+            Defaults to False.
+        batch_size (int, optional): The number of inputs converted
+            in one batch. Defaults to 1000.
+        n_jobs (int, optional): The number of worker processes that convert
+            batches in parallel. If ``-1``, all CPU cores are used.
+            If not provided, all batches are converted in the current process.
+            The output order is the same regardless of this argument.
+            Parallelization is not available in Pyodide, where this argument
+            is ignored.
+
+    Returns:
+        Iterator[list[tuple[str, str]]]: The converted inputs,
+        in the same order as *texts*.
+
+    Raises:
+        ValueError: If *batch_size* is not a positive integer,
+            or if *n_jobs* is neither a positive integer nor ``-1``.
+
+    Examples:
+        >>> list(characters_to_jyutping_many(["香港人講廣東話。", "蛋糕"]))
+        [[('香港人', 'hoeng1gong2jan4'), ('講', 'gong2'), ('廣東話', 'gwong2dung1waa2'), ('。', None)],
+         [('蛋糕', 'daan6gou1')]]
+    """  # noqa: E501
+    # Validate the arguments here, as the generator doesn't run until iterated.
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer: {batch_size}")
+    n_workers = _get_n_workers(n_jobs)
+    return _iter_characters_to_jyutping(texts, presegmented, batch_size, n_workers)
+
+
+_TONES = str.maketrans("", "", "123456")
+
+
+class _JyutpingIndex(NamedTuple):
+    """Words sorted by their Jyutping keys, and then by rank."""
+
+    keys: list[str]
+    ranks: array
+
+
+class _ReverseIndex(NamedTuple):
+    words_by_rank: list[str]
+    with_tones: _JyutpingIndex
+    without_tones: _JyutpingIndex
+
+
+@lru_cache(maxsize=1)
+def _get_reverse_index() -> _ReverseIndex:
+    words_to_jyutping, chars_to_jp = _get_words_characters_to_jyutping()
+    _, _, word_counts, char_counts = _get_hkcancor_lexicon()
+    # In the same order of precedence as the ChainMaps.
+    entries = {**chars_to_jp.maps[1], **words_to_jyutping.maps[1]}
+    entries.update(CHARS_TO_JYUTPING.items())
+    # A character seen only within longer words still counts as frequent.
+    counts = dict(word_counts)
+    for char, count in char_counts.items():
+        counts[char] = max(count, counts.get(char, 0))
+    # Rank by HKCanCor frequency, then shorter Jyutping first (so that
+    # exact matches come before longer ones in prefix lookups).
+    words_by_rank = sorted(
+        entries,
+        key=lambda word: (-counts.get(word, 0), len(entries[word]), word),
+    )
+    keys_by_rank = [entries[word] for word in words_by_rank]
+
+    def build_index(keys: list[str]) -> _JyutpingIndex:
+        # Sorting is stable, so the ranks of the same key stay in order.
+        ranks = sorted(range(len(keys)), key=keys.__getitem__)
+        return _JyutpingIndex(
+            keys=[keys[rank] for rank in ranks], ranks=array("l", ranks)
+        )
+
+    return _ReverseIndex(
+        words_by_rank=words_by_rank,
+        with_tones=build_index(keys_by_rank),
+        without_tones=build_index([key.translate(_TONES) for key in keys_by_rank]),
+    )
+
+
+def jyutping_to_characters(
+    jyutping: str, *, prefix: bool = False, limit: int | None = None
+) -> list[str]:
+    """Find the words with the given Jyutping romanization.
+
+    This is the reverse of :func:`~pycantonese.characters_to_jyutping`,
+    e.g., for listing homophones or the candidates in an input method.
+    The words come from the same HKCanCor and rime-cantonese data,
+    and are ranked by their frequency in HKCanCor.
+    The lookup index is built on first use, which takes a moment,
+    and subsequent lookups are fast.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        jyutping (str): Jyutping romanization, either with tones
+            (e.g., ``"gwong2dung1waa2"``) or without any tones
+            (e.g., ``"gwongdungwaa"``).
+        prefix (bool, optional): If True, find the words whose Jyutping
+            starts with *jyutping* (e.g., ``"gwong2dung1"`` finds 廣東話),
+            as when the Jyutping is being typed. Defaults to False.
+        limit (int, optional): The maximum number of words to return.
+            If not provided, all words found are returned.
+
+    Returns:
+        list[str]: The words found, most frequent first.
+
+    Raises:
+        ValueError: If *limit* is negative.
+
+    Examples:
+        >>> jyutping_to_characters("gwong2dung1waa2")
+        ['廣東話']
+        >>> jyutping_to_characters("hoeng1gong2", prefix=True, limit=3)
+        ['香港', '香港人', '香港區']
+    """
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must not be negative: {limit}")
+    index = _get_reverse_index()
+    key = jyutping.lower()
+    if key.translate(_TONES) == key:
+        keys, ranks = index.without_tones
+    else:
+        keys, ranks = index.with_tones
+    lo = bisect_left(keys, key)
+    if prefix:
+        # Jyutping is in ASCII letters and digits, which all sort before "~".
+        hi = bisect_left(keys, key + "~", lo)
+    else:
+        hi = bisect_right(keys, key, lo)
+    if limit is None:
+        found_ranks = sorted(ranks[lo:hi])
+    else:
+        found_ranks = heapq.nsmallest(limit, ranks[lo:hi])
+    words_by_rank = index.words_by_rank
+    return [words_by_rank[rank] for rank in found_ranks]
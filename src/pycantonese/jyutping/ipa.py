@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache, partial
 
-from .parse_jyutping import parse_jyutping
+from ._romanization import (
+    _compile_forward,
+    _compile_reverse,
+    _convert_many,
+    _ReverseTable,
+    _to_jyutping_syllables,
+)
+from .parse_jyutping import Jyutping, _look_up_syllables, parse_jyutping
 
 _ONSETS = {
     "b": "p",
@@ -64,12 +73,221 @@ _TONES = {
 }
 
 
-@lru_cache
-def _replace(current, parsed, part_to_match, matches, default):
-    if getattr(parsed, part_to_match) in matches:
-        return default
-    else:
-        return current
+def _syllable_to_ipa(
+    onsets: dict[str, str],
+    nuclei: dict[str, str],
+    codas: dict[str, str],
+    tones: dict[str, str],
+    jp: Jyutping,
+) -> str:
+    """Convert one parsed Jyutping syllable into IPA, with custom symbols."""
+    onset = _ONSETS[jp.onset]
+    nucleus = _NUCLEI[jp.nucleus]
+    coda = _CODAS[jp.coda]
+    tone = _TONES[jp.tone]
+
+    if (n := jp.nucleus) == "i":
+        if jp.coda in ("ng", "k"):
+            nucleus = "ɪ"
+    elif n == "u":
+        if jp.coda in ("ng", "k"):
+            nucleus = "ʊ"
+    elif n == "e":
+        if jp.coda == "i":
+            nucleus = "e"
+    elif n == "o":
+        if jp.coda == "u":
+            nucleus = "o"
+
+    if jp.coda == "i" and jp.nucleus in ("eo", "u", "o"):
+        coda = "y"
+
+    onset = onsets.get(jp.onset, onset)
+    nucleus = nuclei.get(jp.nucleus, nucleus)
+    coda = codas.get(jp.coda, coda)
+    tone = tones.get(jp.tone, tone)
+
+    return onset + nucleus + coda + tone
+
+
+class IPAConverter:
+    """Converter between Jyutping and IPA with custom IPA symbols.
+
+    The IPA of every well-formed Jyutping syllable, with the custom symbols,
+    is computed once when the converter is created. Converting a Jyutping
+    string is then a table lookup for each syllable. To convert a lot of
+    Jyutping with the same custom symbols (e.g., a whole corpus),
+    create a converter once and reuse it, instead of calling
+    :func:`~pycantonese.jyutping_to_ipa` with the custom symbols each time.
+    The converter also converts IPA with its symbols back into Jyutping.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        onsets (dict[str, str], optional): Same as in
+            :func:`~pycantonese.jyutping_to_ipa`.
+        nuclei (dict[str, str], optional): Same as in
+            :func:`~pycantonese.jyutping_to_ipa`.
+        codas (dict[str, str], optional): Same as in
+            :func:`~pycantonese.jyutping_to_ipa`.
+        tones (dict[str, str], optional): Same as in
+            :func:`~pycantonese.jyutping_to_ipa`.
+
+    Examples:
+        >>> converter = IPAConverter(onsets={"c": "tʃʰ"}, tones={"1": "˥"})
+        >>> converter.convert("ci1faan6")
+        ['tʃʰi˥', 'faːn22']
+        >>> converter.convert_many(["ci1", "gwong2dung1waa2"], return_as="string")
+        ['tʃʰi˥', 'kʷɔŋ25 tʊŋ˥ waː25']
+        >>> converter.to_jyutping("tʃʰi˥ faːn22")
+        'ci1faan6'
+    """
+
+    def __init__(
+        self,
+        *,
+        onsets: dict[str, str] | None = None,
+        nuclei: dict[str, str] | None = None,
+        codas: dict[str, str] | None = None,
+        tones: dict[str, str] | None = None,
+    ):
+        # Copies, so that changing the dicts afterwards doesn't make
+        # the table out of date.
+        self._symbols = (
+            dict(onsets or {}),
+            dict(nuclei or {}),
+            dict(codas or {}),
+            dict(tones or {}),
+        )
+        # E.g., the onset "v" has no IPA symbol, so it's not in the table.
+        self._table = _compile_forward(partial(_syllable_to_ipa, *self._symbols))
+        # Built on first use, as converting IPA into Jyutping is less common.
+        self._reverse: _ReverseTable | None = None
+
+    def __repr__(self) -> str:
+        onsets, nuclei, codas, tones = self._symbols
+        return (
+            f"{type(self).__name__}(onsets={onsets!r}, nuclei={nuclei!r}, "
+            f"codas={codas!r}, tones={tones!r})"
+        )
+
+    def _convert(self, jp_str) -> list[str]:
+        if not jp_str or not isinstance(jp_str, str):
+            return [
+                _syllable_to_ipa(*self._symbols, jp) for jp in parse_jyutping(jp_str)
+            ]
+        ipa_list = _look_up_syllables(jp_str, self._table)
+        if ipa_list is None:
+            # Not in the table: parse the syllables and convert them one by one,
+            # which raises the appropriate error.
+            return [
+                _syllable_to_ipa(*self._symbols, jp) for jp in parse_jyutping(jp_str)
+            ]
+        return ipa_list
+
+    def convert(self, jp_str: str, return_as: str = "list") -> list[str] | str:
+        """Convert Jyutping romanization into IPA.
+
+        Args:
+            jp_str (str): Jyutping romanization for one or multiple characters.
+            return_as (str, optional): Same as in
+                :func:`~pycantonese.jyutping_to_ipa`. Defaults to ``"list"``.
+
+        Returns:
+            list[str] | str
+
+        Raises:
+            ValueError: If the Jyutping romanization is illegal (e.g., with
+                unrecognized elements).
+        """
+        ipa_list = self._convert(jp_str)
+        if return_as == "list":
+            return ipa_list
+        else:
+            return " ".join(ipa_list)
+
+    def convert_many(
+        self, jp_strs: Iterable[str], return_as: str = "list"
+    ) -> list[list[str]] | list[str]:
+        """Convert many Jyutping strings into IPA.
+
+        Args:
+            jp_strs (Iterable[str]): Jyutping romanization strings, each for
+                one or multiple characters.
+            return_as (str, optional): Same as in
+                :func:`~pycantonese.jyutping_to_ipa`. Defaults to ``"list"``.
+
+        Returns:
+            list[list[str]] | list[str]
+
+        Raises:
+            ValueError: If any of the Jyutping romanization strings is illegal
+                (e.g., with unrecognized elements).
+        """
+        if return_as == "list":
+            return [self._convert(jp_str) for jp_str in jp_strs]
+        else:
+            return [" ".join(self._convert(jp_str)) for jp_str in jp_strs]
+
+    def _to_jyutping(self, ipa_str) -> str:
+        if not ipa_str:
+            return ""
+        if not isinstance(ipa_str, str):
+            raise ValueError("argument needs to be a string -- " + repr(ipa_str))
+        if self._reverse is None:
+            self._reverse = _compile_reverse(self._table)
+        reverse = self._reverse
+        jp_syllables = []
+        for part in unicodedata.normalize("NFC", ipa_str).split():
+            if (jp := reverse.syllables.get(part)) is not None:
+                jp_syllables.append(jp)
+                continue
+            part_jp_syllables = _to_jyutping_syllables(part, reverse)
+            if part_jp_syllables is None:
+                raise ValueError("unrecognized IPA -- " + repr(part))
+            jp_syllables.extend(part_jp_syllables)
+        return "".join(jp_syllables)
+
+    def to_jyutping(self, ipa_str: str) -> str:
+        """Convert IPA into Jyutping romanization.
+
+        This is the reverse of :meth:`convert`, with this converter's
+        IPA symbols. The syllables can be separated by spaces
+        (as in the output of ``convert(..., return_as="string")``)
+        or written together.
+
+        Args:
+            ipa_str (str): IPA for one or multiple characters.
+
+        Returns:
+            str
+
+        Raises:
+            ValueError: If the IPA can't be split into the IPA of
+                known Jyutping syllables.
+        """
+        return self._to_jyutping(ipa_str)
+
+    def to_jyutping_many(self, ipa_strs: Iterable[str]) -> list[str]:
+        """Convert many IPA strings into Jyutping romanization.
+
+        Args:
+            ipa_strs (Iterable[str]): IPA strings, each for one or multiple
+                characters, as in :meth:`to_jyutping`.
+
+        Returns:
+            list[str]
+
+        Raises:
+            ValueError: If any of the IPA strings can't be split into the IPA
+                of known Jyutping syllables.
+        """
+        return _convert_many(ipa_strs, self._to_jyutping)
+
+
+@lru_cache(maxsize=1)
+def _get_default_converter() -> IPAConverter:
+    return IPAConverter()
 
 
 def jyutping_to_ipa(
@@ -84,6 +302,8 @@ def jyutping_to_ipa(
     """Convert Jyutping romanization into IPA.
 
     The Jyutping-to-IPA mapping is based on Matthews and Yip (2011: 461-463).
+    To convert a lot of Jyutping with the same custom symbols,
+    use :class:`~pycantonese.jyutping.IPAConverter` instead.
 
     Args:
         jp_str (str): Jyutping romanization for one or multiple characters.
@@ -125,35 +345,68 @@ def jyutping_to_ipa(
         >>> jyutping_to_ipa('ci1', tones={'1': "˥"})
         ['tsʰi˥']
     """
-    jp_parsed_list = parse_jyutping(jp_str)
-    ipa_list = []
-
-    for jp_parsed in jp_parsed_list:
-        onset = _ONSETS[jp_parsed.onset]
-        nucleus = _NUCLEI[jp_parsed.nucleus]
-        coda = _CODAS[jp_parsed.coda]
-        tone = _TONES[jp_parsed.tone]
-
-        if (n := jp_parsed.nucleus) == "i":
-            nucleus = _replace(nucleus, jp_parsed, "coda", ("ng", "k"), "ɪ")
-        elif n == "u":
-            nucleus = _replace(nucleus, jp_parsed, "coda", ("ng", "k"), "ʊ")
-        elif n == "e":
-            nucleus = _replace(nucleus, jp_parsed, "coda", ("i",), "e")
-        elif n == "o":
-            nucleus = _replace(nucleus, jp_parsed, "coda", ("u",), "o")
-
-        if jp_parsed.coda == "i":
-            coda = _replace(coda, jp_parsed, "nucleus", ("eo", "u", "o"), "y")
-
-        onset = (onsets or {}).get(jp_parsed.onset, onset)
-        nucleus = (nuclei or {}).get(jp_parsed.nucleus, nucleus)
-        coda = (codas or {}).get(jp_parsed.coda, coda)
-        tone = (tones or {}).get(jp_parsed.tone, tone)
-
-        ipa_list.append(onset + nucleus + coda + tone)
+    if onsets or nuclei or codas or tones:
+        # Only compile a converter's table for the custom symbols
+        # if it's reused, i.e., with IPAConverter.
+        ipa_list = [
+            _syllable_to_ipa(onsets or {}, nuclei or {}, codas or {}, tones or {}, jp)
+            for jp in parse_jyutping(jp_str)
+        ]
+    else:
+        ipa_list = _get_default_converter()._convert(jp_str)
 
     if return_as == "list":
         return ipa_list
     else:
         return " ".join(ipa_list)
+
+
+def ipa_to_jyutping(ipa_str: str) -> str:
+    """Convert IPA into Jyutping romanization.
+
+    This is the reverse of :func:`~pycantonese.jyutping_to_ipa`
+    with the default IPA symbols. The syllables can be separated by spaces
+    (as in the output of ``jyutping_to_ipa(..., return_as="string")``)
+    or written together. For custom IPA symbols, use
+    :meth:`IPAConverter.to_jyutping <pycantonese.jyutping.IPAConverter.to_jyutping>`.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        ipa_str (str): IPA for one or multiple characters.
+
+    Returns:
+        str
+
+    Raises:
+        ValueError: If the IPA can't be split into the IPA of
+            known Jyutping syllables.
+
+    Examples:
+        >>> ipa_to_jyutping("kʷɔŋ25 tʊŋ55 waː25")  # 廣東話 Cantonese
+        'gwong2dung1waa2'
+    """
+    return _get_default_converter()._to_jyutping(ipa_str)
+
+
+def ipa_to_jyutping_many(ipa_strs: Iterable[str]) -> list[str]:
+    """Convert many IPA strings into Jyutping romanization.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        ipa_strs (Iterable[str]): IPA strings, each for one or multiple
+            characters, as in :func:`~pycantonese.ipa_to_jyutping`.
+
+    Returns:
+        list[str]
+
+    Raises:
+        ValueError: If any of the IPA strings can't be split into the IPA
+            of known Jyutping syllables.
+
+    Examples:
+        >>> ipa_to_jyutping_many(["m21 kɔy55", "hei33 hɐu22"])
+        ['m4goi1', 'hei3hau6']
+    """
+    return _get_default_converter().to_jyutping_many(ipa_strs)
@@ -0,0 +1,123 @@
+"""The characters-to-Jyutping lexicon from HKCanCor.
+
+The lexicon maps each word and each character seen in HKCanCor to its most
+common Jyutping romanization, with the number of times that it occurs with
+that romanization. Building it means reading and parsing all of HKCanCor,
+so the lexicon is built ahead of time and shipped as ``hkcancor_lexicon.tsv.gz``.
+Whenever the HKCanCor data changes, rebuild it with:
+
+    python -m pycantonese.jyutping.lexicon
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+from collections import Counter, defaultdict
+
+from ..corpus import hkcancor, Token
+from ..jyutping.parse_jyutping import parse_jyutping
+
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+_LEXICON_PATH = os.path.join(_THIS_DIR, "hkcancor_lexicon.tsv.gz")
+
+
+def _build_hkcancor_lexicon() -> (
+    tuple[dict[str, str], dict[str, str], dict[str, int], dict[str, int]]
+):
+    """Build the Jyutping and count dicts of the words and characters."""
+    corpus = hkcancor()
+    words_to_jyutping_counters = defaultdict(Counter)
+    characters_to_jyutping_counters = defaultdict(Counter)
+
+    for token in corpus.tokens():
+        token: Token
+        word = token.word
+        jyutping = token.jyutping
+
+        if not jyutping or not word:
+            continue
+        try:
+            parsed_jp = parse_jyutping(jyutping)
+        except ValueError:
+            continue
+        if len(word) != len(parsed_jp):
+            continue
+        words_to_jyutping_counters[word][jyutping] += 1
+        for char, jp in zip(word, parsed_jp):
+            characters_to_jyutping_counters[char][str(jp)] += 1
+
+    words_to_jyutping = {}
+    word_counts = {}
+    for word, jyutping_counter in words_to_jyutping_counters.items():
+        jp, count = jyutping_counter.most_common(1)[0]
+        words_to_jyutping[word] = jp
+        word_counts[word] = count
+    chars_to_jp = {}
+    char_counts = {}
+    for character, jyutping_counter in characters_to_jyutping_counters.items():
+        jp, count = jyutping_counter.most_common(1)[0]
+        chars_to_jp[character] = jp
+        char_counts[character] = count
+
+    return words_to_jyutping, chars_to_jp, word_counts, char_counts
+
+
+def _write_hkcancor_lexicon(
+    words_to_jyutping: dict[str, str],
+    chars_to_jyutping: dict[str, str],
+    word_counts: dict[str, int],
+    char_counts: dict[str, int],
+    path: str = _LEXICON_PATH,
+) -> None:
+    """Write the lexicon as two tab-separated blocks, with a blank line between.
+
+    The lines of the first block are the words with their Jyutping and counts,
+    and the lines of the second block are the same for the characters.
+    """
+    blocks = [
+        "".join(f"{key}\t{jp}\t{counts[key]}\n" for key, jp in mapping.items())
+        for mapping, counts in (
+            (words_to_jyutping, word_counts),
+            (chars_to_jyutping, char_counts),
+        )
+    ]
+    # mtime=0 keeps the file the same if the data hasn't changed.
+    with open(path, "wb") as f:
+        f.write(gzip.compress("\n".join(blocks).encode("utf8"), mtime=0))
+
+
+def _read_hkcancor_lexicon(
+    path: str = _LEXICON_PATH,
+) -> tuple[dict[str, str], dict[str, str], dict[str, int], dict[str, int]]:
+    """Read the lexicon written by :func:`_write_hkcancor_lexicon`."""
+    with open(path, "rb") as f:
+        text = gzip.decompress(f.read()).decode("utf8")
+    result = []
+    for block in text.split("\n\n"):
+        to_jyutping = {}
+        counts = {}
+        for line in block.splitlines():
+            key, jp, count = line.split("\t")
+            to_jyutping[key] = jp
+            counts[key] = int(count)
+        result.append((to_jyutping, counts))
+    (words_to_jyutping, word_counts), (chars_to_jyutping, char_counts) = result
+    return words_to_jyutping, chars_to_jyutping, word_counts, char_counts
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO")
+    words_to_jyutping, chars_to_jyutping, word_counts, char_counts = (
+        _build_hkcancor_lexicon()
+    )
+    _write_hkcancor_lexicon(
+        words_to_jyutping, chars_to_jyutping, word_counts, char_counts
+    )
+    logging.info(
+        "Wrote %d words and %d characters to %s",
+        len(words_to_jyutping),
+        len(chars_to_jyutping),
+        _LEXICON_PATH,
+    )
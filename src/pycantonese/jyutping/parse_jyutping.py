@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import re
+from array import array
+from functools import lru_cache
+from typing import ClassVar, Iterable, TypeVar
 
 ONSETS = {
     "b",
@@ -37,6 +41,11 @@ TONES = {"1", "2", "3", "4", "5", "6"}
 # "ng" before "n"). Python's NFA regex engine tries alternatives left-to-right and
 # backtracks on failure, which correctly resolves ambiguities like "m4" (onset="m"
 # fails -> backtracks to nucleus="m") and "hng6" (onset="h", nucleus="ng").
+# Like the regular expression below, also accept a syllabic "n".
+_NUCLEI = NUCLEI | {"n"}
+
+_T = TypeVar("_T")
+
 _JYUTPING_SYLLABLE_RE = re.compile(
     r"(?P<onset>gw|kw|ng|[bdgzptkcmnfhslwjv])?"
     r"(?P<nucleus>aa|oe|eo|yu|ng|[aeioumn])"
@@ -45,10 +54,14 @@ _JYUTPING_SYLLABLE_RE = re.compile(
 )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Jyutping:
     """Jyutping representation of a Chinese/Cantonese character.
 
+    .. versionchanged:: 4.3.0
+        Jyutping objects are immutable, so that :func:`parse_jyutping`
+        can return the same object for every occurrence of a syllable.
+
     Attributes:
         onset (str): Onset
         nucleus (str): Nucleus
@@ -56,7 +69,6 @@ class Jyutping:
         tone (str): Tone
     """
 
-    __slots__ = ("onset", "nucleus", "coda", "tone")
     onset: str
     nucleus: str
     coda: str
@@ -100,43 +112,232 @@ def parse_jyutping(jp_str) -> list[Jyutping]:
     if not isinstance(jp_str, str):
         raise ValueError("argument needs to be a string -- " + repr(jp_str))
     jp_str = jp_str.lower()
+    syllables = _get_syllables()
 
-    # Split into individual syllables at tone digits
-    jp_list = []
-    jp_current = ""
-    for c in jp_str:
-        jp_current = jp_current + c
-        if c.isdigit():
-            jp_list.append(jp_current)
-            jp_current = ""
+    # Most calls are for a single syllable (e.g., of one character).
+    if (jp := syllables.get(jp_str)) is not None:
+        return [jp]
 
     if not jp_str[-1].isdigit():
         raise ValueError("tone error -- " + repr(jp_str[-1]))
 
+    # Split into individual syllables at tone digits
     jp_parsed_list = []
-
-    for jp in jp_list:
-        if len(jp) < 2:
-            raise ValueError(
-                "jyutping string has fewer than 2 characters -- " + repr(jp)
-            )
-
-        match = _JYUTPING_SYLLABLE_RE.fullmatch(jp)
-        if match:
-            jp_parsed_list.append(
-                Jyutping(
-                    match.group("onset") or "",
-                    match.group("nucleus"),
-                    match.group("coda") or "",
-                    match.group("tone"),
-                )
-            )
-        else:
-            _raise_detailed_error(jp)
+    start = 0
+    for end, c in enumerate(jp_str, 1):
+        if c.isdigit():
+            syllable = jp_str[start:end]
+            if (jp := syllables.get(syllable)) is None:
+                if len(syllable) < 2:
+                    raise ValueError(
+                        "jyutping string has fewer than 2 characters -- "
+                        + repr(syllable)
+                    )
+                _raise_detailed_error(syllable)
+            jp_parsed_list.append(jp)
+            start = end
 
     return jp_parsed_list
 
 
+@lru_cache(maxsize=1)
+def _get_syllables() -> dict[str, Jyutping]:
+    """Return the table of all well-formed syllables to their Jyutping objects.
+
+    The syllables are all the combinations of an onset, a nucleus, a coda,
+    and a tone. Where two combinations spell the same syllable (e.g., "mm1"
+    is onset "m" + nucleus "m", or nucleus "m" + coda "m"), the syllable is
+    parsed the way the regular expression does.
+    """
+    syllables = {}
+    for parts in itertools.product(ONSETS, _NUCLEI, CODAS, TONES):
+        syllable = "".join(parts)
+        if syllable in syllables:
+            continue
+        match = _JYUTPING_SYLLABLE_RE.fullmatch(syllable)
+        syllables[syllable] = Jyutping(
+            match.group("onset") or "",
+            match.group("nucleus"),
+            match.group("coda") or "",
+            match.group("tone"),
+        )
+    return syllables
+
+
+@dataclasses.dataclass(frozen=True)
+class JyutpingArrays:
+    """Parsed Jyutping of many strings, in integer-coded columns.
+
+    Syllable *k* has the onset ``onset_labels[onsets[k]]``, and likewise
+    for the nucleus and coda, and the tone ``tones[k]`` (from 1 to 6).
+    The syllables of input string *i* are those
+    from ``offsets[i]`` up to (but not including) ``offsets[i + 1]``.
+    An invalid input string has no syllables and ``errors[i] == 1``.
+
+    .. versionadded:: 4.3.0
+
+    Attributes:
+        onsets (array.array): Onset code of each syllable.
+        nuclei (array.array): Nucleus code of each syllable.
+        codas (array.array): Coda code of each syllable.
+        tones (array.array): Tone of each syllable.
+        offsets (array.array): Index of the first syllable of each
+            input string, followed by the total number of syllables.
+        errors (array.array): 1 for each invalid input string, otherwise 0.
+        onset_labels (tuple[str, ...]): Onsets by their codes.
+        nucleus_labels (tuple[str, ...]): Nuclei by their codes.
+        coda_labels (tuple[str, ...]): Codas by their codes.
+    """
+
+    onsets: array
+    nuclei: array
+    codas: array
+    tones: array
+    offsets: array
+    errors: array
+
+    onset_labels: ClassVar[tuple[str, ...]] = tuple(sorted(ONSETS))
+    nucleus_labels: ClassVar[tuple[str, ...]] = tuple(sorted(_NUCLEI))
+    coda_labels: ClassVar[tuple[str, ...]] = tuple(sorted(CODAS))
+
+    def __len__(self) -> int:
+        """Return the number of input strings."""
+        return len(self.errors)
+
+    def jyutping(self, index: int) -> list[Jyutping] | None:
+        """Return the parsed Jyutping of an input string.
+
+        Args:
+            index (int): Index of the input string.
+
+        Returns:
+            list[Jyutping] or None: Same as :func:`parse_jyutping`,
+            or None if the input string is invalid.
+        """
+        if self.errors[index]:
+            return None
+        syllables = _get_syllables()
+        return [
+            syllables[
+                f"{self.onset_labels[self.onsets[k]]}"
+                f"{self.nucleus_labels[self.nuclei[k]]}"
+                f"{self.coda_labels[self.codas[k]]}"
+                f"{self.tones[k]}"
+            ]
+            for k in range(self.offsets[index], self.offsets[index + 1])
+        ]
+
+
+@lru_cache(maxsize=1)
+def _get_syllable_codes() -> dict[str, bytes]:
+    """Return the table of all well-formed syllables to their codes.
+
+    The codes of a syllable are 4 bytes: onset, nucleus, coda, and tone.
+    """
+    onset_codes = {label: i for i, label in enumerate(JyutpingArrays.onset_labels)}
+    nucleus_codes = {label: i for i, label in enumerate(JyutpingArrays.nucleus_labels)}
+    coda_codes = {label: i for i, label in enumerate(JyutpingArrays.coda_labels)}
+    return {
+        syllable: bytes(
+            [
+                onset_codes[jp.onset],
+                nucleus_codes[jp.nucleus],
+                coda_codes[jp.coda],
+                int(jp.tone),
+            ]
+        )
+        for syllable, jp in _get_syllables().items()
+    }
+
+
+def _look_up_syllables(jp_str: str, table: dict[str, _T]) -> list[_T] | None:
+    """Split Jyutping at the tone digits and look up each syllable in *table*.
+
+    Return None if any syllable isn't in the table.
+    """
+    jp_str = jp_str.lower()
+    if (value := table.get(jp_str)) is not None:
+        return [value]
+    values = []
+    start = 0
+    for end, c in enumerate(jp_str, 1):
+        if c.isdigit():
+            if (value := table.get(jp_str[start:end])) is None:
+                return None
+            values.append(value)
+            start = end
+    if start != len(jp_str):
+        # No tone at the end.
+        return None
+    return values
+
+
+def _parse_codes(jp_str: str, codes: dict[str, bytes]) -> bytes | None:
+    """Return the codes of the syllables of a string, or None if it's invalid."""
+    if (parts := _look_up_syllables(jp_str, codes)) is None:
+        return None
+    return b"".join(parts)
+
+
+def parse_jyutping_many(jp_strs: Iterable[str]) -> JyutpingArrays:
+    """Parse many strings of Jyutping romanization into columns.
+
+    The syllables of all the strings are parsed into integer-coded arrays of
+    onsets, nuclei, codas, and tones, for counting or aggregating them
+    without creating a :class:`Jyutping` object for each syllable.
+    Invalid strings are marked in an error mask instead of raising an error.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        jp_strs (Iterable[str]): Jyutping romanization strings, each for one
+            or multiple characters, as in :func:`parse_jyutping`.
+
+    Returns:
+        JyutpingArrays
+
+    Examples:
+        >>> parsed = parse_jyutping_many(["gwong2dung1waa2", "hou7", "m4goi1"])
+        >>> list(parsed.offsets), list(parsed.errors)
+        ([0, 3, 3, 5], [0, 1, 0])
+        >>> [parsed.onset_labels[code] for code in parsed.onsets]
+        ['gw', 'd', 'w', '', 'g']
+        >>> list(parsed.tones)
+        [2, 1, 2, 4, 1]
+    """
+    codes = _get_syllable_codes()
+    # The codes of all the syllables, 4 bytes per syllable.
+    all_codes = array("B")
+    offsets = array("l", [0])
+    errors = array("B")
+    # Corpus data repeats the same strings a lot, so each one is parsed once.
+    parsed: dict[str, bytes | None] = {}
+    for jp_str in jp_strs:
+        if not jp_str:
+            jp_codes = b""
+        elif not isinstance(jp_str, str):
+            jp_codes = None
+        elif jp_str in parsed:
+            jp_codes = parsed[jp_str]
+        else:
+            jp_codes = parsed[jp_str] = _parse_codes(jp_str, codes)
+        if jp_codes is None:
+            errors.append(1)
+        else:
+            all_codes.frombytes(jp_codes)
+            errors.append(0)
+        offsets.append(len(all_codes) >> 2)
+
+    return JyutpingArrays(
+        onsets=all_codes[0::4],
+        nuclei=all_codes[1::4],
+        codas=all_codes[2::4],
+        tones=all_codes[3::4],
+        offsets=offsets,
+        errors=errors,
+    )
+
+
 def _raise_detailed_error(jp: str) -> None:
     """Analyze a failed Jyutping syllable and raise a descriptive ValueError."""
     tone = jp[-1]
@@ -1,4 +1,11 @@
-from pycantonese.jyutping.parse_jyutping import parse_jyutping
+from functools import lru_cache
+
+from pycantonese.jyutping._romanization import _compile_forward
+from pycantonese.jyutping.parse_jyutping import (
+    Jyutping,
+    _look_up_syllables,
+    parse_jyutping,
+)
 
 ONSETS_TIPA = {
     "b": "p",
@@ -90,6 +97,19 @@ TONES_TIPA = {
 }
 
 
+def _jyutping_syllable_to_tipa(jp_parsed: Jyutping) -> str:
+    """Convert one parsed Jyutping syllable into TIPA."""
+    # TODO: Separate "final" as "nucleus" and "coda" instead?
+    tipa = ONSETS_TIPA[jp_parsed.onset] + FINALS_TIPA[jp_parsed.final]
+    return tipa.strip() + TONES_TIPA[jp_parsed.tone]
+
+
+@lru_cache(maxsize=1)
+def _get_tipa_syllables() -> dict[str, str]:
+    """Return the table of all well-formed Jyutping syllables to TIPA."""
+    return _compile_forward(_jyutping_syllable_to_tipa)
+
+
 def jyutping_to_tipa(jp_str):
     """Convert Jyutping romanization into LaTeX TIPA.
 
@@ -107,13 +127,11 @@ def jyutping_to_tipa(jp_str):
         >>> jyutping_to_tipa("gwong2dung1waa2")  # 廣東話, Cantonese  # doctest: +SKIP
         ['k\\super w ON25', 'tUN55', 'wa25']
     """  # noqa: E501
-    jp_parsed_list = parse_jyutping(jp_str)
-    tipa_list = []
-
-    for jp_parsed in jp_parsed_list:
-        # TODO: Separate "final" as "nucleus" and "coda" instead?
-        tipa = ONSETS_TIPA[jp_parsed.onset] + FINALS_TIPA[jp_parsed.final]
-        tipa = tipa.strip() + TONES_TIPA[jp_parsed.tone]
-        tipa_list.append(tipa)
-
+    if not jp_str or not isinstance(jp_str, str):
+        return [_jyutping_syllable_to_tipa(jp) for jp in parse_jyutping(jp_str)]
+    tipa_list = _look_up_syllables(jp_str, _get_tipa_syllables())
+    if tipa_list is None:
+        # Not in the table: parse the syllables and convert them one by one,
+        # which raises the appropriate error.
+        return [_jyutping_syllable_to_tipa(jp) for jp in parse_jyutping(jp_str)]
     return tipa_list
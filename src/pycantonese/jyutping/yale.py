@@ -1,7 +1,23 @@
+from __future__ import annotations
+
+import re
 import unicodedata
+from collections.abc import Iterable
 from functools import lru_cache
-
-from pycantonese.jyutping.parse_jyutping import parse_jyutping
+from typing import NamedTuple
+
+from pycantonese.jyutping._romanization import (
+    _compile_forward,
+    _compile_reverse,
+    _convert_many,
+    _ReverseTable,
+    _to_jyutping_syllables,
+)
+from pycantonese.jyutping.parse_jyutping import (
+    Jyutping,
+    _look_up_syllables,
+    parse_jyutping,
+)
 
 ONSETS_YALE = {
     "b": "b",
@@ -54,7 +70,189 @@ CODAS_YALE = {
 }
 
 
-@lru_cache
+_AMBIGUOUS_CONSONANTS = {"h", "p", "t", "k", "m", "n", "ng"}
+_VOWEL_LETTERS = {
+    "a",
+    "e",
+    "i",
+    "o",
+    "u",
+    "á",
+    "é",
+    "í",
+    "ó",
+    "ú",
+    "à",
+    "è",
+    "ì",
+    "ò",
+    "ù",
+    "ā",
+    "ē",
+    "ī",
+    "ō",
+    "ū",
+}
+
+
+class _YaleSyllable(NamedTuple):
+    yale: str
+    # For the syllable boundaries that are ambiguous in a string of Yale.
+    ends_with_ambiguous_consonant: bool
+    starts_with_vowel: bool
+    starts_with_ambiguous_consonant: bool
+
+
+def _jyutping_syllable_to_yale(jp_parsed: Jyutping) -> _YaleSyllable:
+    """Convert one parsed Jyutping syllable into Yale."""
+    onset = ONSETS_YALE[jp_parsed.onset]
+    nucleus = NUCLEI_YALE[jp_parsed.nucleus]
+    coda = CODAS_YALE[jp_parsed.coda]
+    tone = jp_parsed.tone  # still in parse_jyutping
+
+    # jyutping2yale system uses "h" to mark the three low tones
+    if tone in {"4", "5", "6"}:
+        low_tone_h = "h"
+    else:
+        low_tone_h = ""
+
+    # in jyutping2yale, long "aa" vowel with no coda is denoted by "a"
+    if nucleus == "aa" and coda == "":
+        nucleus = "a"
+
+    # when nucleus is "yu"...
+    # 1. disallow "yyu" (when onset is "y")
+    # 2. change nucleus "yu" into "u" -- this is a hack for adding tone
+    #       diacritic, since we don't want "y" to bear the diacritic
+    if nucleus == "yu":
+        if onset == "y":
+            onset = ""
+        nucleus = "u"
+
+    # when nucleus is "ng"
+    # the tone diacritic has to be on "g" but not "n"
+    # now we pretend that the nucleus is "g", and will prepend the "n" back
+    # at the end
+    if nucleus == "ng":
+        nucleus = "g"
+
+    # add the jyutping2yale tone diacritic to the first nucleus letter
+    # parse_jyutping tone 1      --> add macron
+    # parse_jyutping tone 2 or 5 --> add acute
+    # parse_jyutping tone 4      --> add grave
+    # parse_jyutping tone 3 or 6 --> (no diacritic)
+    # If the accented letter doesn't exist in unicode, use the combining
+    # accent instead.
+
+    letter = nucleus[0]  # nucleus 1st letter
+    unicode_letter_name = unicodedata.name(letter)
+    if tone == "1":
+        try:
+            letter_with_diacritic = unicodedata.lookup(
+                unicode_letter_name + " WITH MACRON"
+            )
+        except KeyError:
+            letter_with_diacritic = letter + "\u0304"
+    elif tone in {"2", "5"}:
+        try:
+            letter_with_diacritic = unicodedata.lookup(
+                unicode_letter_name + " WITH ACUTE"
+            )
+        except KeyError:
+            letter_with_diacritic = letter + "\u0301"
+    elif tone == "4":
+        try:
+            letter_with_diacritic = unicodedata.lookup(
+                unicode_letter_name + " WITH GRAVE"
+            )
+        except KeyError:
+            letter_with_diacritic = letter + "\u0300"
+    else:
+        # either tone 3 or tone 6
+        letter_with_diacritic = letter
+    nucleus = letter_with_diacritic + nucleus[1:]
+
+    # add back "y" if the nucleus is "yu"
+    # ("y" was taken away for convenience in adding tone diacritic)
+    if jp_parsed.nucleus == "yu":
+        nucleus = "y" + nucleus
+
+    # add back "n" if the nucleus is "ng"
+    # ('n' was taken away so that tone diacritic is on "g" but not "n")
+    if jp_parsed.nucleus == "ng":
+        nucleus = "n" + nucleus
+
+    # parse_jyutping final "eu" should be jyutping2yale "ew" (not "eu")
+    if coda == "u" and nucleus == "e":
+        coda = "w"
+
+    # save the resultant jyutping2yale
+    if coda in {"i", "u", "w"} and tone in {"4", "5", "6"}:
+        yale = onset + nucleus + coda + low_tone_h
+    else:
+        yale = onset + nucleus + low_tone_h + coda
+    return _YaleSyllable(
+        yale,
+        _endswithoneof(yale, _AMBIGUOUS_CONSONANTS) is not None,
+        _startswithoneof(yale, _VOWEL_LETTERS) is not None,
+        _startswithoneof(yale, _AMBIGUOUS_CONSONANTS) is not None,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_yale_syllables() -> dict[str, _YaleSyllable]:
+    """Return the table of all well-formed Jyutping syllables to Yale."""
+    return _compile_forward(_jyutping_syllable_to_yale)
+
+
+@lru_cache(maxsize=1)
+def _get_yale_reverse_table() -> _ReverseTable:
+    """Return the table of Yale syllables to Jyutping."""
+    return _compile_reverse(
+        {syllable: yale.yale for syllable, yale in _get_yale_syllables().items()}
+    )
+
+
+def _to_yale_syllables(jp_str) -> list[_YaleSyllable]:
+    """Split Jyutping into syllables and look them up in the Yale table."""
+    if not jp_str or not isinstance(jp_str, str):
+        return [_jyutping_syllable_to_yale(jp) for jp in parse_jyutping(jp_str)]
+    yale_syllables = _look_up_syllables(jp_str, _get_yale_syllables())
+    if yale_syllables is None:
+        # Not in the table: parse the syllables and convert them one by one,
+        # which raises the appropriate error.
+        return [_jyutping_syllable_to_yale(jp) for jp in parse_jyutping(jp_str)]
+    return yale_syllables
+
+
+def _is_ambiguous(yale1: _YaleSyllable, yale2: _YaleSyllable) -> bool:
+    """Return whether the boundary between two Yale syllables is ambiguous."""
+    # Ambiguity case 1:
+    #   1st syllable coda is one of the "ambiguous_consonants"
+    #   and 2nd syllable starts with a vowel *letter*
+
+    # Ambiguity case 2:
+    #   1st syllable has no coda and 2nd syllable starts with one of the
+    #   "ambiguous_consonants"
+    #   e.g., hei3hau6 'climate' --> heihauh
+    #   (middle "h" for tone in 1st syllable or being onset of 2nd syllable?)
+    if yale1.ends_with_ambiguous_consonant:
+        return yale2.starts_with_vowel
+    return yale2.starts_with_ambiguous_consonant
+
+
+def _join_yale(yale_syllables: list[_YaleSyllable]) -> str:
+    """Join Yale syllables, with "'" at the ambiguous syllable boundaries."""
+    if not yale_syllables:
+        return ""
+    parts = [yale_syllables[0].yale]
+    for yale1, yale2 in zip(yale_syllables, yale_syllables[1:]):
+        if _is_ambiguous(yale1, yale2):
+            parts.append("'")
+        parts.append(yale2.yale)
+    return "".join(parts)
+
+
 def jyutping_to_yale(jp_str, return_as="list"):
     """Convert Jyutping romanization into Yale romanization.
 
@@ -83,173 +281,134 @@ def jyutping_to_yale(jp_str, return_as="list"):
         >>> jyutping_to_yale("hei3hau6", return_as="string")  # 氣候, climate
         "hei'hauh"
     """
-    jp_parsed_list = parse_jyutping(jp_str)
-    yale_list = []
-
-    for jp_parsed in jp_parsed_list:
-        onset = ONSETS_YALE[jp_parsed.onset]
-        nucleus = NUCLEI_YALE[jp_parsed.nucleus]
-        coda = CODAS_YALE[jp_parsed.coda]
-        tone = jp_parsed.tone  # still in parse_jyutping
-
-        # jyutping2yale system uses "h" to mark the three low tones
-        if tone in {"4", "5", "6"}:
-            low_tone_h = "h"
-        else:
-            low_tone_h = ""
-
-        # in jyutping2yale, long "aa" vowel with no coda is denoted by "a"
-        if nucleus == "aa" and coda == "":
-            nucleus = "a"
-
-        # when nucleus is "yu"...
-        # 1. disallow "yyu" (when onset is "y")
-        # 2. change nucleus "yu" into "u" -- this is a hack for adding tone
-        #       diacritic, since we don't want "y" to bear the diacritic
-        if nucleus == "yu":
-            if onset == "y":
-                onset = ""
-            nucleus = "u"
-
-        # when nucleus is "ng"
-        # the tone diacritic has to be on "g" but not "n"
-        # now we pretend that the nucleus is "g", and will prepend the "n" back
-        # at the end
-        if nucleus == "ng":
-            nucleus = "g"
-
-        # add the jyutping2yale tone diacritic to the first nucleus letter
-        # parse_jyutping tone 1      --> add macron
-        # parse_jyutping tone 2 or 5 --> add acute
-        # parse_jyutping tone 4      --> add grave
-        # parse_jyutping tone 3 or 6 --> (no diacritic)
-        # If the accented letter doesn't exist in unicode, use the combining
-        # accent instead.
-
-        letter = nucleus[0]  # nucleus 1st letter
-        unicode_letter_name = unicodedata.name(letter)
-        if tone == "1":
-            try:
-                letter_with_diacritic = unicodedata.lookup(
-                    unicode_letter_name + " WITH MACRON"
-                )
-            except KeyError:
-                letter_with_diacritic = letter + "\u0304"
-        elif tone in {"2", "5"}:
-            try:
-                letter_with_diacritic = unicodedata.lookup(
-                    unicode_letter_name + " WITH ACUTE"
-                )
-            except KeyError:
-                letter_with_diacritic = letter + "\u0301"
-        elif tone == "4":
-            try:
-                letter_with_diacritic = unicodedata.lookup(
-                    unicode_letter_name + " WITH GRAVE"
-                )
-            except KeyError:
-                letter_with_diacritic = letter + "\u0300"
-        else:
-            # either tone 3 or tone 6
-            letter_with_diacritic = letter
-        nucleus = letter_with_diacritic + nucleus[1:]
-
-        # add back "y" if the nucleus is "yu"
-        # ("y" was taken away for convenience in adding tone diacritic)
-        if jp_parsed.nucleus == "yu":
-            nucleus = "y" + nucleus
-
-        # add back "n" if the nucleus is "ng"
-        # ('n' was taken away so that tone diacritic is on "g" but not "n")
-        if jp_parsed.nucleus == "ng":
-            nucleus = "n" + nucleus
-
-        # parse_jyutping final "eu" should be jyutping2yale "ew" (not "eu")
-        if coda == "u" and nucleus == "e":
-            coda = "w"
-
-        # save the resultant jyutping2yale
-        if coda in {"i", "u", "w"} and tone in {"4", "5", "6"}:
-            yale = onset + nucleus + coda + low_tone_h
-        else:
-            yale = onset + nucleus + low_tone_h + coda
-        yale_list.append(yale)
+    yale_syllables = _to_yale_syllables(jp_str)
+    if return_as == "list":
+        return [yale_syllable.yale for yale_syllable in yale_syllables]
+    return _join_yale(yale_syllables)
+
+
+def jyutping_to_yale_many(jp_strs, return_as="list"):
+    """Convert many Jyutping strings into Yale romanization.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        jp_strs (Iterable[str]): Jyutping romanization strings, each for one
+            or multiple characters.
+        return_as (str, optional): Same as in
+            :func:`~pycantonese.jyutping_to_yale`. Defaults to ``"list"``.
+
+    Returns:
+        list[list[str]], or list[str] if return_as is "string"
+
+    Raises:
+        ValueError: If any of the Jyutping romanization strings is illegal
+            (e.g., with unrecognized elements).
 
+    Examples:
+        >>> jyutping_to_yale_many(["gwong2dung1waa2", "hei3hau6"], return_as="string")
+        ['gwóngdūngwá', "hei'hauh"]
+    """
     if return_as == "list":
-        return yale_list
+        return [
+            [yale_syllable.yale for yale_syllable in _to_yale_syllables(jp_str)]
+            for jp_str in jp_strs
+        ]
+    return [_join_yale(_to_yale_syllables(jp_str)) for jp_str in jp_strs]
 
-    # Output yale_list as a string
-    # Check if there's potential ambiguity when Yale strings are concatenated
 
-    # Ambiguity case 1:
-    #   1st syllable coda is one of the "ambiguous_consonants"
-    #   and 2nd syllable starts with a vowel *letter*
+# Syllables are split at whitespace and at the quote that disambiguates
+# a syllable boundary, as well as the typographic quote.
+_YALE_SEPARATORS_RE = re.compile(r"[\s'’]+")
+
+
+def _is_ambiguous_yale(yale1: str, yale2: str) -> bool:
+    to_jyutping = _get_yale_reverse_table().syllables
+    yale_syllables = _get_yale_syllables()
+    return _is_ambiguous(
+        yale_syllables[to_jyutping[yale1]], yale_syllables[to_jyutping[yale2]]
+    )
 
-    # Ambiguity case 2:
-    #   1st syllable has no coda and 2nd syllable starts with one of the
-    #   "ambiguous_consonants"
-    #   e.g., hei3hau6 'climate' --> heihauh
-    #   (middle "h" for tone in 1st syllable or being onset of 2nd syllable?)
 
-    if len(yale_list) == 0:
+def _yale_to_jyutping(yale_str) -> str:
+    if not yale_str:
         return ""
-    elif len(yale_list) == 1:
-        return yale_list[0]
-
-    ambiguous_consonants = {"h", "p", "t", "k", "m", "n", "ng"}
-    vowel_letters = {
-        "a",
-        "e",
-        "i",
-        "o",
-        "u",
-        "á",
-        "é",
-        "í",
-        "ó",
-        "ú",
-        "à",
-        "è",
-        "ì",
-        "ò",
-        "ù",
-        "ā",
-        "ē",
-        "ī",
-        "ō",
-        "ū",
-    }
-
-    output_str = ""
-
-    for i in range(len(yale_list) - 1):
-        yale1 = yale_list[i]
-        yale2 = yale_list[i + 1]
-
-        ambiguous = False
-
-        # test case 1:
-        if _endswithoneof(yale1, ambiguous_consonants) and _startswithoneof(
-            yale2, vowel_letters
-        ):
-            ambiguous = True
-
-        # test case 2:
-        if (
-            not ambiguous
-            and not _endswithoneof(yale1, ambiguous_consonants)
-            and _startswithoneof(yale2, ambiguous_consonants)
-        ):
-            ambiguous = True
-
-        output_str += yale1
-
-        if ambiguous:
-            output_str += "'"
-
-    output_str += yale_list[-1]
-
-    return output_str
+    if not isinstance(yale_str, str):
+        raise ValueError("argument needs to be a string -- " + repr(yale_str))
+    reverse = _get_yale_reverse_table()
+    jp_syllables = []
+    text = unicodedata.normalize("NFC", yale_str.lower())
+    for part in _YALE_SEPARATORS_RE.split(text):
+        if not part:
+            continue
+        if (jp := reverse.syllables.get(part)) is not None:
+            jp_syllables.append(jp)
+            continue
+        part_jp_syllables = _to_jyutping_syllables(part, reverse, _is_ambiguous_yale)
+        if part_jp_syllables is None:
+            raise ValueError("unrecognized Yale romanization -- " + repr(part))
+        jp_syllables.extend(part_jp_syllables)
+    return "".join(jp_syllables)
+
+
+def yale_to_jyutping(yale_str: str) -> str:
+    """Convert Yale romanization into Jyutping romanization.
+
+    The Yale romanization is expected in the form of the output of
+    :func:`~pycantonese.jyutping_to_yale`, with tone diacritics and
+    the low-tone marker "h". The syllables can be written together
+    (with the quote ``'`` at ambiguous syllable boundaries, as in the output
+    of ``jyutping_to_yale(..., return_as="string")``) or separated by spaces.
+    Where syllables written together can be split in more than one way
+    (e.g., "yīngwóng" as "jing1wong2" or "jin1gwong2"), the split
+    with the most common syllables in the rime-cantonese data is chosen.
+    Some Jyutping syllables have the same Yale spelling
+    (e.g., "goek3" and "geok3" are both "geuk"); the Yale syllable is
+    converted into the Jyutping syllable that is the most common
+    in the rime-cantonese data.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        yale_str (str): Yale romanization for one or multiple characters.
+
+    Returns:
+        str
+
+    Raises:
+        ValueError: If the Yale romanization can't be split into known
+            Yale syllables.
+
+    Examples:
+        >>> yale_to_jyutping("gwóngdūngwá")  # 廣東話, Cantonese
+        'gwong2dung1waa2'
+        >>> yale_to_jyutping("hei'hauh")  # 氣候, climate
+        'hei3hau6'
+    """
+    return _yale_to_jyutping(yale_str)
+
+
+def yale_to_jyutping_many(yale_strs: Iterable[str]) -> list[str]:
+    """Convert many Yale romanization strings into Jyutping romanization.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        yale_strs (Iterable[str]): Yale romanization strings, each for one
+            or multiple characters, as in :func:`~pycantonese.yale_to_jyutping`.
+
+    Returns:
+        list[str]
+
+    Raises:
+        ValueError: If any of the Yale romanization strings can't be split
+            into known Yale syllables.
+
+    Examples:
+        >>> yale_to_jyutping_many(["m̀hgōi", "hei'hauh"])
+        ['m4goi1', 'hei3hau6']
+    """
+    return _convert_many(yale_strs, _yale_to_jyutping)
 
 
 def _startswithoneof(inputstr, seq):
@@ -1,13 +1,16 @@
-import concurrent.futures as cf
 import functools
 import multiprocessing as mp
 import re
-import sys
 from string import ascii_uppercase
 
+from pycantonese._parallel import _IS_WASM, _parallel_imap
 from pycantonese.corpus import CHAT
-from pycantonese.jyutping.characters import characters_to_jyutping
-from pycantonese.pos_tagging.tagger import pos_tag
+from pycantonese.jyutping.characters import (
+    _init_worker as _init_characters_worker,
+    characters_to_jyutping,
+)
+from pycantonese.pos_tagging.tagger import _get_tagger, pos_tag
+from pycantonese.word_segmentation.segmenter import _get_default_segmenter
 
 # Punctuation marks for utterance segmentation.
 _UTTERANCE_PUNCT_MARKS = frozenset(("。", "！", "？"))
@@ -15,11 +18,16 @@ _ASCII_UPPERCASE = frozenset(ascii_uppercase)
 
 _UNKNOWN_PARTICIPANT = "X"
 
-_IS_WASM = sys.platform == "emscripten"
 _CPU_COUNT = mp.cpu_count()
 _CHUNK_SIZE = 4
 
 
+def _init_worker(user_words):
+    """Load the models used for parsing in a worker process."""
+    _init_characters_worker(user_words)
+    _get_tagger()
+
+
 def _parse_text(text: str, pos_tag_kwargs):
     chars_jps = characters_to_jyutping(text)
     segmented, jyutping = [], []
@@ -135,8 +143,15 @@ def parse_text(
             pos_tag_kwargs=pos_tag_kwargs,
             participant=participant,
         )
-        with cf.ProcessPoolExecutor() as executor:
-            utterances = list(executor.map(func, data, chunksize=_CHUNK_SIZE))
+        utterances = list(
+            _parallel_imap(
+                func,
+                data,
+                initializer=_init_worker,
+                initargs=(list(_get_default_segmenter()._user_words),),
+                chunksize=_CHUNK_SIZE,
+            )
+        )
     else:
         utterances = [
             _get_utterance(sent, pos_tag_kwargs, participant) for sent in data
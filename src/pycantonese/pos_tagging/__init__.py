@@ -1,4 +1,21 @@
-from pycantonese.pos_tagging.hkcancor_to_ud import hkcancor_to_ud
-from pycantonese.pos_tagging.tagger import _POSTagger
+from pycantonese.pos_tagging.hkcancor_to_ud import (
+    TAG_VOCABULARY,
+    TagVocabulary,
+    hkcancor_to_ud,
+)
+from pycantonese.pos_tagging.tagger import (
+    _POSTagger,
+    pos_tag_cache_clear,
+    pos_tag_cache_info,
+    set_pos_tag_cache,
+)
 
-__all__ = ["_POSTagger", "hkcancor_to_ud"]
+__all__ = [
+    "TAG_VOCABULARY",
+    "TagVocabulary",
+    "_POSTagger",
+    "hkcancor_to_ud",
+    "pos_tag_cache_clear",
+    "pos_tag_cache_info",
+    "set_pos_tag_cache",
+]
@@ -1,5 +1,7 @@
 """POS tagset mapping between HKCanCor and Universal Dependencies."""
 
+from array import array
+
 from pycantonese._punctuation_marks import _PUNCTUATION_MARKS
 
 # The Python dictionary below maps the HKCanCor tagset to the Universal
@@ -132,6 +134,124 @@ _MAP = {
 _MAP = {**_MAP, **{punct: "PUNCT" for punct in _PUNCTUATION_MARKS}}
 
 
+# The Universal Dependencies v2 tagset, in the order of its documentation.
+_UD_TAGS = (
+    "ADJ",
+    "ADP",
+    "ADV",
+    "AUX",
+    "CCONJ",
+    "DET",
+    "INTJ",
+    "NOUN",
+    "NUM",
+    "PART",
+    "PRON",
+    "PROPN",
+    "PUNCT",
+    "SCONJ",
+    "SYM",
+    "VERB",
+    "X",
+)
+
+
+class _TagTable(dict):
+    """A tag mapping with a default value for any unrecognized tag.
+
+    This is for mapping many tags with ``map(table.__getitem__, tags)``,
+    without the overhead of calling :func:`hkcancor_to_ud` for each tag.
+    """
+
+    def __init__(self, mapping, default):
+        super().__init__(mapping)
+        self._default = default
+
+    def __missing__(self, key):
+        return self._default
+
+
+class _StrippedTagTable(_TagTable):
+    """A tag mapping that strips whitespace from the tag, like :func:`hkcancor_to_ud`.
+
+    Tags without whitespace around them are looked up as in :class:`_TagTable`.
+    """
+
+    def __missing__(self, key):
+        stripped = key.strip()
+        if stripped != key:
+            return self[stripped]
+        return self._default
+
+
+class TagVocabulary:
+    """Integer ids for the part-of-speech tags.
+
+    The ids are the positions of the tags in :attr:`hkcancor_tags` and
+    :attr:`ud_tags`, and are what :func:`~pycantonese.pos_tag` and
+    :func:`~pycantonese.pos_tag_many` return with ``return_ids=True``.
+    Use the instance at ``pycantonese.pos_tagging.TAG_VOCABULARY``.
+
+    .. versionadded:: 4.3.0
+
+    Attributes:
+        hkcancor_tags (tuple[str, ...]): The HKCanCor tags in sorted order,
+            including the punctuation marks (which are their own tags).
+            The tag with id 0 is the empty tag ``""``, which also stands for
+            any tag outside of this vocabulary.
+        ud_tags (tuple[str, ...]): The 17 Universal Dependencies v2 tags.
+        hkcancor_to_ud_ids (array.array): The Universal Dependencies tag id
+            for each HKCanCor tag id, as in :func:`hkcancor_to_ud`.
+
+    Examples:
+        >>> TAG_VOCABULARY.hkcancor_id("v")
+        70
+        >>> TAG_VOCABULARY.ud_tags[TAG_VOCABULARY.hkcancor_to_ud_ids[70]]
+        'VERB'
+    """
+
+    def __init__(self):
+        self.hkcancor_tags = ("", *sorted(tag for tag in _MAP if tag))
+        self.ud_tags = _UD_TAGS
+        ud_ids = {tag: i for i, tag in enumerate(self.ud_tags)}
+        self.hkcancor_to_ud_ids = array(
+            "B", (ud_ids[_UD_TABLE[tag]] for tag in self.hkcancor_tags)
+        )
+        self._hkcancor_ids = _TagTable(
+            {tag: i for i, tag in enumerate(self.hkcancor_tags)}, 0
+        )
+        self._ud_ids = _TagTable(ud_ids, ud_ids["X"])
+        # From HKCanCor tags straight to UD tag ids.
+        self._hkcancor_to_ud_ids = _StrippedTagTable(
+            zip(self.hkcancor_tags, self.hkcancor_to_ud_ids), ud_ids["X"]
+        )
+        # For returning the same string object for every occurrence of a tag.
+        self._hkcancor_tags_interned = {tag: tag for tag in self.hkcancor_tags}
+
+    def hkcancor_id(self, tag: str) -> int:
+        """Return the id of an HKCanCor tag.
+
+        Args:
+            tag (str): An HKCanCor tag.
+
+        Returns:
+            int: The tag id, or 0 if the tag is not in the vocabulary.
+        """
+        return self._hkcancor_ids[tag]
+
+    def ud_id(self, tag: str) -> int:
+        """Return the id of a Universal Dependencies tag.
+
+        Args:
+            tag (str): A Universal Dependencies tag.
+
+        Returns:
+            int: The tag id, or the id of ``"X"`` if the tag is not
+            in the vocabulary.
+        """
+        return self._ud_ids[tag]
+
+
 def hkcancor_to_ud(tag: str | None = None):
     """Map a part-of-speech tag from HKCanCor to Universal Dependencies.
 
@@ -165,3 +285,8 @@ def hkcancor_to_ud(tag: str | None = None):
         return _MAP
     else:
         return _MAP.get(tag.strip()) or "X"
+
+
+_UD_TABLE = _StrippedTagTable({tag: hkcancor_to_ud(tag) for tag in _MAP}, "X")
+
+TAG_VOCABULARY = TagVocabulary()
@@ -1,14 +1,25 @@
 import functools
 import os
+from array import array
+from itertools import islice
+from typing import Iterable
 
 from rustling.perceptron_pos_tagger import AveragedPerceptron
 
 from pycantonese._punctuation_marks import _PUNCTUATION_MARKS
-from pycantonese.pos_tagging.hkcancor_to_ud import hkcancor_to_ud
+from pycantonese.pos_tagging.hkcancor_to_ud import TAG_VOCABULARY, _UD_TABLE
 
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 _MODEL_PATH = os.path.join(_THIS_DIR, "tagger.fb.zst")
 
+# The environment variable with the path of a model to load instead of
+# the default one, e.g., a compact model from train_tagger.py --compact.
+# Worker processes inherit it, unlike a model loaded in this process.
+_MODEL_PATH_ENV_VAR = "PYCANTONESE_TAGGER_MODEL"
+
+_TAGSETS = frozenset({"universal", "hkcancor"})
+_DEFAULT_BATCH_SIZE = 1000
+
 
 class _POSTagger(AveragedPerceptron):
     """A part-of-speech tagger.
@@ -77,22 +88,44 @@ class _POSTagger(AveragedPerceptron):
         Returns:
             list[list[str]]: The list of predicted tag sequences.
         """
-        tags = super().predict(sequences)
-        for seq_tags, seq_words in zip(tags, sequences):
-            for i, word in enumerate(seq_words):
-                if word in self._punctuation_tags:
-                    seq_tags[i] = self._punctuation_tags[word]
-        return tags
+        get_punct_tag = self._punctuation_tags.get
+        return [
+            list(map(get_punct_tag, seq_words, seq_tags))
+            for seq_words, seq_tags in zip(sequences, super().predict(sequences))
+        ]
+
+    def fit(self, sequences, tags):
+        """Fit a model.
+
+        Any result cached by :func:`~pycantonese.pos_tag` is discarded.
+
+        Args:
+            sequences (list[list[str]]): A list of segmented sentences.
+            tags (list[list[str]]): The tags of the words in *sequences*.
+        """
+        super().fit(sequences, tags)
+        pos_tag_cache_clear()
+
+    def load(self, path):
+        """Load a model from a file.
+
+        Any result cached by :func:`~pycantonese.pos_tag` is discarded.
+
+        Args:
+            path (str): The path to the model file.
+        """
+        super().load(path)
+        pos_tag_cache_clear()
 
 
 @functools.lru_cache(maxsize=1)
 def _get_tagger():
     tagger = _POSTagger()
-    tagger.load(_MODEL_PATH)
+    tagger.load(os.environ.get(_MODEL_PATH_ENV_VAR) or _MODEL_PATH)
     return tagger
 
 
-def pos_tag(words, tagset="universal"):
+def pos_tag(words, tagset="universal", *, return_ids=False):
     """Tag the words for their parts of speech.
 
     The part-of-speech tagger uses an averaged perceptron model,
@@ -115,10 +148,18 @@ def pos_tag(words, tagset="universal"):
               Internally, this option applies
               :func:`~pycantonese.pos_tagging.hkcancor_to_ud` to convert
               HKCanCor tags to UD tags.
+        return_ids (bool, optional): If True, return the ids of the tags
+            in *tagset* as an :class:`array.array` of type ``"B"``, without
+            the words. The ids are defined by
+            :class:`~pycantonese.pos_tagging.TagVocabulary`.
+            Defaults to False.
+
+            .. versionadded:: 4.3.0
 
     Returns:
-        list[tuple[str, str]]: The segmented sentence/phrase where each word
-        is paired with its predicted POS tag.
+        list[tuple[str, str]] or array.array: The segmented sentence/phrase
+        where each word is paired with its predicted POS tag,
+        or the tag ids if *return_ids* is True.
 
     Raises:
         TypeError: If the input is a string (e.g., an unsegmented string of
@@ -132,14 +173,162 @@ def pos_tag(words, tagset="universal"):
         [('我', 'PRON'), ('噚日', 'ADV'), ('買', 'VERB'), ('嗰', 'PRON'), ('對', 'NOUN'), ('鞋', 'NOUN'), ('。', 'PUNCT')]
         >>> pos_tag(words, tagset="hkcancor")
         [('我', 'r'), ('噚日', 't'), ('買', 'v'), ('嗰', 'r'), ('對', 'q'), ('鞋', 'n'), ('。', '。')]
+        >>> pos_tag(words, return_ids=True)
+        array('B', [10, 2, 15, 10, 7, 7, 12])
     """  # noqa: E501
     if isinstance(words, str):
         raise TypeError(
             f"Input must be a list of segmented words, not a string: {words}"
         )
-    tags = _get_tagger().predict([words])[0]
-    if tagset == "universal":
-        tags = [hkcancor_to_ud(tag) for tag in tags]
-    elif tagset != "hkcancor":
+    _check_tagset(tagset)
+    if (cached_pos_tag := _cached_pos_tag) is not None:
+        result = cached_pos_tag(tuple(words), tagset, return_ids)
+        return array("B", result) if return_ids else list(result)
+    return _pos_tag_batch([words], tagset, return_ids)[0]
+
+
+def _pos_tag_for_cache(words: tuple[str, ...], tagset: str, return_ids: bool):
+    """Tag the words, returning an immutable result for caching."""
+    result = _pos_tag_batch([list(words)], tagset, return_ids)[0]
+    return result.tobytes() if return_ids else tuple(result)
+
+
+# The LRU-cached version of _pos_tag_for_cache(), or None if disabled.
+_cached_pos_tag = None
+
+
+def set_pos_tag_cache(maxsize: int | None = 1024) -> None:
+    """Enable, resize, or disable the result cache of :func:`~pycantonese.pos_tag`.
+
+    The cache is disabled by default. When enabled, :func:`~pycantonese.pos_tag`
+    returns the cached result of a previously seen sentence (keyed by the words
+    and the ``tagset`` and ``return_ids`` arguments), skipping the tagger.
+    The least recently used result is evicted when the cache is full.
+    The cache is safe to share across threads, and is cleared whenever
+    the tagger is reloaded or retrained.
+    Calling this function discards any previously cached results.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        maxsize (int or None, optional): The maximum number of cached results.
+            If ``0``, the cache is disabled. If ``None``, the cache can grow
+            without bound. Defaults to 1024.
+
+    Examples:
+        >>> set_pos_tag_cache(10_000)
+        >>> pos_tag(["我", "噚日", "買", "嗰", "對", "鞋", "。"])
+        [('我', 'PRON'), ('噚日', 'ADV'), ('買', 'VERB'), ('嗰', 'PRON'), ('對', 'NOUN'), ('鞋', 'NOUN'), ('。', 'PUNCT')]
+        >>> pos_tag_cache_info()
+        CacheInfo(hits=0, misses=1, maxsize=10000, currsize=1)
+        >>> set_pos_tag_cache(0)  # Disable the cache.
+    """  # noqa: E501
+    global _cached_pos_tag
+    if maxsize == 0:
+        _cached_pos_tag = None
+    else:
+        _cached_pos_tag = functools.lru_cache(maxsize=maxsize)(_pos_tag_for_cache)
+
+
+def pos_tag_cache_info():
+    """Return the statistics of the result cache of :func:`~pycantonese.pos_tag`.
+
+    .. versionadded:: 4.3.0
+
+    Returns:
+        functools._CacheInfo or None: A named tuple of ``hits``, ``misses``,
+        ``maxsize``, and ``currsize``, like that of
+        :func:`functools.lru_cache`, or ``None`` if the cache is disabled.
+    """
+    if (cached_pos_tag := _cached_pos_tag) is None:
+        return None
+    return cached_pos_tag.cache_info()
+
+
+def pos_tag_cache_clear() -> None:
+    """Clear the result cache and statistics of :func:`~pycantonese.pos_tag`.
+
+    .. versionadded:: 4.3.0
+    """
+    if (cached_pos_tag := _cached_pos_tag) is not None:
+        cached_pos_tag.cache_clear()
+
+
+def _check_tagset(tagset):
+    if tagset not in _TAGSETS:
         raise ValueError(f"tagset must be one of {{'universal', 'hkcancor'}}: {tagset}")
-    return list(zip(words, tags))
+
+
+def _pos_tag_batch(sentences, tagset, return_ids=False):
+    """Tag a batch of sentences with a single call to the model."""
+    tags_batch = _get_tagger().predict(sentences)
+    if return_ids:
+        if tagset == "universal":
+            to_id = TAG_VOCABULARY._hkcancor_to_ud_ids.__getitem__
+        else:
+            to_id = TAG_VOCABULARY._hkcancor_ids.__getitem__
+        return [array("B", map(to_id, tags)) for tags in tags_batch]
+    if tagset == "universal":
+        to_ud = _UD_TABLE.__getitem__
+        tags_batch = [list(map(to_ud, tags)) for tags in tags_batch]
+    else:
+        # Share one string object per tag across all the results.
+        intern = TAG_VOCABULARY._hkcancor_tags_interned.get
+        tags_batch = [list(map(intern, tags, tags)) for tags in tags_batch]
+    return [list(zip(words, tags)) for words, tags in zip(sentences, tags_batch)]
+
+
+def pos_tag_many(
+    sentences: Iterable[list[str]],
+    tagset: str = "universal",
+    *,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    return_ids: bool = False,
+) -> list[list[tuple[str, str]]] | list[array]:
+    """Tag many sentences for their parts of speech.
+
+    The result is the same as calling :func:`~pycantonese.pos_tag` on each
+    sentence, but the sentences are sent to the tagger in batches,
+    which avoids the per-call overhead for large numbers of sentences.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        sentences (Iterable[list[str]]): Segmented sentences or phrases,
+            where each word is a string of Cantonese characters.
+        tagset (str, {"universal", "hkcancor"}): The part-of-speech tagset
+            that the returned tags are in, as in :func:`~pycantonese.pos_tag`.
+        batch_size (int, optional): The number of sentences sent to the tagger
+            in one call. Defaults to 1000.
+        return_ids (bool, optional): If True, return the tag ids of each
+            sentence, as in :func:`~pycantonese.pos_tag`. Defaults to False.
+
+    Returns:
+        list[list[tuple[str, str]]] or list[array.array]: The tagged sentences,
+        in the same order as *sentences*.
+
+    Raises:
+        TypeError: If a sentence is a string (e.g., an unsegmented string of
+            Cantonese).
+        ValueError: If the ``tagset`` argument is not one of the allowed
+            options from ``{"universal", "hkcancor"}``,
+            or if *batch_size* is not a positive integer.
+
+    Examples:
+        >>> pos_tag_many([['我', '噚日', '買', '嗰', '對', '鞋', '。'], ['好', '靚']])
+        [[('我', 'PRON'), ('噚日', 'ADV'), ('買', 'VERB'), ('嗰', 'PRON'), ('對', 'NOUN'), ('鞋', 'NOUN'), ('。', 'PUNCT')],
+         [('好', 'ADV'), ('靚', 'ADJ')]]
+    """  # noqa: E501
+    _check_tagset(tagset)
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer: {batch_size}")
+    sentences = iter(sentences)
+    result = []
+    while batch := list(islice(sentences, batch_size)):
+        for words in batch:
+            if isinstance(words, str):
+                raise TypeError(
+                    f"Input must be a list of segmented words, not a string: {words}"
+                )
+        result.extend(_pos_tag_batch(batch, tagset, return_ids))
+    return result
@@ -1,3 +1,27 @@
-from pycantonese.word_segmentation.segmenter import segment
+from pycantonese.word_segmentation.incremental import (
+    IncrementalSegmenter,
+    SegmentationDiff,
+)
+from pycantonese.word_segmentation.segmenter import (
+    add_words,
+    load_user_dict,
+    remove_words,
+    segment,
+    segment_cache_clear,
+    segment_cache_info,
+    segment_many,
+    set_segment_cache,
+)
 
-__all__ = ["segment"]
+__all__ = [
+    "IncrementalSegmenter",
+    "SegmentationDiff",
+    "add_words",
+    "load_user_dict",
+    "remove_words",
+    "segment",
+    "segment_cache_clear",
+    "segment_cache_info",
+    "segment_many",
+    "set_segment_cache",
+]
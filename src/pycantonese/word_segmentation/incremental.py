@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import dataclasses
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import neg
+from typing import Literal
+
+from pycantonese.word_segmentation.segmenter import _segment_batch
+
+_DEFAULT_CONTEXT = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class SegmentationDiff:
+    """Change in the segmentation after an edit.
+
+    Replacing ``removed`` with ``added`` at word index ``index`` of the
+    previous segmentation gives the current segmentation.
+
+    Attributes:
+        index (int): Word index where the change starts.
+        removed (list[tuple[str, tuple[int, int]]]): Words with their offsets
+            in the text before the edit.
+        added (list[tuple[str, tuple[int, int]]]): Words with their offsets
+            in the text after the edit.
+    """
+
+    index: int
+    removed: list[tuple[str, tuple[int, int]]]
+    added: list[tuple[str, tuple[int, int]]]
+
+
+class IncrementalSegmenter:
+    """Word segmenter that keeps its result up to date with edits to the text.
+
+    After an edit, only a window of words around the edit is re-segmented.
+    The window extends by *context* words on either side of the words that
+    the edit touches. Unless the window reaches the start or the end of
+    the text, the *context* words at each of its edges must come out the same
+    as before; otherwise, the window is widened by another *context* words
+    on that side and re-segmented.
+    The words are those from :func:`~pycantonese.segment`
+    (including the user dictionary), though in rare cases where the model
+    would draw on context beyond the window, they may differ from
+    segmenting the whole text at once. A larger *context* makes this rarer,
+    at the cost of re-segmenting more words per edit. Call :meth:`set_text`
+    to re-segment the whole text.
+
+    Like the gap buffer of a text editor, the word offsets are stored
+    relative to the end of the text after the last edited position,
+    so that an edit doesn't shift the offsets of all the words after it.
+    The cost of an edit depends on the size of the edit and on how far it is
+    from the previous edit, not on the size of the text.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        text (str, optional): Initial text.
+        context (int, optional): Number of words on either side of
+            an edit to re-segment, and to check for changes. Defaults to 8.
+
+    Raises:
+        ValueError: If *context* is less than 1.
+
+    Examples:
+        >>> segmenter = IncrementalSegmenter("廣東話容唔容易學？")
+        >>> segmenter.segment()
+        ['廣東話', '容', '唔', '容易', '學', '？']
+        >>> segmenter.edit(0, 0, "我話")
+        SegmentationDiff(index=0, removed=[], added=[('我', (0, 1)), ('話', (1, 2))])
+        >>> segmenter.segment(offsets=True)[2]
+        ('廣東話', (2, 5))
+    """
+
+    def __init__(self, text: str = "", *, context: int = _DEFAULT_CONTEXT):
+        if context < 1:
+            raise ValueError(f"context must be at least 1: {context}")
+        self._context = context
+        self._text = ""
+        self._words: list[str] = []
+        # For the words before self._gap, self._starts and self._ends hold the
+        # offsets. For the words from self._gap on, they hold
+        # len(self._text) - offset.
+        self._starts = array("l")
+        self._ends = array("l")
+        self._gap = 0
+        self.set_text(text)
+
+    @property
+    def text(self) -> str:
+        """The current text."""
+        return self._text
+
+    def set_text(self, text: str) -> None:
+        """Replace the whole text and segment it from scratch.
+
+        Args:
+            text (str): New text.
+        """
+        words, starts, ends = _segment_batch([text], offsets="array")[0]
+        self._words, self._starts, self._ends = words, starts, ends
+        self._gap = len(words)
+        self._text = text
+
+    def segment(
+        self, *, offsets: bool | Literal["array"] = False
+    ) -> list[str] | list[tuple[str, tuple[int, int]]] | tuple[list[str], array, array]:
+        """Return the segmentation of the current text.
+
+        Args:
+            offsets (bool or str, optional): Same as in
+                :func:`~pycantonese.segment`. Defaults to False.
+
+        Returns:
+            list[str] or list[tuple[str, tuple[int, int]]]
+            or tuple[list[str], array.array, array.array]
+        """
+        if not offsets:
+            return list(self._words)
+        self._move_gap(len(self._words))
+        if offsets == "array":
+            return list(self._words), array("l", self._starts), array("l", self._ends)
+        return list(zip(self._words, zip(self._starts, self._ends)))
+
+    def _move_gap(self, index: int) -> None:
+        """Move the gap to *index*, converting the offsets in between."""
+        lo, hi = sorted((self._gap, index))
+        if lo < hi:
+            # The conversion is the same both ways: x -> len(text) - x.
+            to_other_side = len(self._text).__sub__
+            starts, ends = self._starts, self._ends
+            starts[lo:hi] = array("l", map(to_other_side, starts[lo:hi]))
+            ends[lo:hi] = array("l", map(to_other_side, ends[lo:hi]))
+        self._gap = index
+
+    def _bisect_ends(self, position: int) -> int:
+        """Return the index of the first word ending at or after *position*."""
+        ends, gap = self._ends, self._gap
+        index = bisect_left(ends, position, 0, gap)
+        if index < gap:
+            return index
+        return bisect_left(ends, position - len(self._text), gap, key=neg)
+
+    def _bisect_starts(self, position: int) -> int:
+        """Return the index of the first word starting after *position*."""
+        starts, gap = self._starts, self._gap
+        index = bisect_right(starts, position, 0, gap)
+        if index < gap:
+            return index
+        return bisect_right(starts, position - len(self._text), gap, key=neg)
+
+    def _extend_left(self, lo: int) -> int:
+        """Move the start of a window back by *context* words."""
+        return max(lo - self._context, 0)
+
+    def _extend_right(self, hi: int) -> int:
+        """Move the end of a window forward by *context* words."""
+        return min(hi + self._context, len(self._words))
+
+    def edit(self, position: int, deleted: int, inserted: str = "") -> SegmentationDiff:
+        """Apply an edit to the text and update the segmentation.
+
+        Args:
+            position (int): Character offset of the edit in the current text.
+            deleted (int): Number of characters deleted from *position*.
+            inserted (str, optional): Text inserted at *position*.
+
+        Returns:
+            SegmentationDiff
+
+        Raises:
+            ValueError: If the edit is out of the bounds of the current text.
+        """
+        old_text = self._text
+        if not 0 <= position <= len(old_text):
+            raise ValueError(f"position out of range: {position}")
+        if deleted < 0 or position + deleted > len(old_text):
+            raise ValueError(f"deleted out of range: {deleted}")
+        edit_end = position + deleted
+        new_text = old_text[:position] + inserted + old_text[edit_end:]
+        delta = len(inserted) - deleted
+
+        words, starts, ends = self._words, self._starts, self._ends
+
+        # Start with the words touching the edit, plus *context* untouched words
+        # on either side.
+        context = self._context
+        lo = self._extend_left(self._bisect_ends(position))
+        hi = self._extend_right(self._bisect_starts(edit_end))
+        while True:
+            # Past the gap, the offsets are relative to the end of the text,
+            # which the edit leaves alone.
+            self._move_gap(hi)
+            window_start = ends[lo - 1] if lo else 0
+            window_end = len(new_text) - (starts[hi] if hi < len(words) else 0)
+            new_words, new_starts, new_ends = _segment_batch(
+                [new_text[window_start:window_end]], offsets="array"
+            )[0]
+            new_starts = array("l", map(window_start.__add__, new_starts))
+            new_ends = array("l", map(window_start.__add__, new_ends))
+            # The window is good if the *context* untouched words at each of
+            # its edges come out the same. Otherwise, the edit affects the words
+            # beyond them (or the model needs more context), so the window is
+            # widened. Punctuation marks don't stop the model from drawing on
+            # the words around them, so they're no different here.
+            left_ok = lo == 0 or (
+                new_words[:context] == words[lo : lo + context]
+                and new_starts[:context] == starts[lo : lo + context]
+                and new_ends[:context] == ends[lo : lo + context]
+            )
+            right_ok = hi == len(words) or (
+                len(new_words) >= context
+                and new_words[-context:] == words[hi - context : hi]
+                and new_starts[-context:]
+                == array("l", [start + delta for start in starts[hi - context : hi]])
+                and new_ends[-context:]
+                == array("l", [end + delta for end in ends[hi - context : hi]])
+            )
+            if left_ok and right_ok:
+                break
+            if not left_ok:
+                lo = self._extend_left(lo)
+            if not right_ok:
+                hi = self._extend_right(hi)
+
+        # Trim the words that didn't change, to keep the diff minimal.
+        n_old = hi - lo
+        n_new = len(new_words)
+        prefix = 0
+        while (
+            prefix < min(n_old, n_new)
+            and words[lo + prefix] == new_words[prefix]
+            and starts[lo + prefix] == new_starts[prefix]
+            and ends[lo + prefix] == new_ends[prefix]
+        ):
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < min(n_old, n_new) - prefix
+            and words[hi - suffix - 1] == new_words[n_new - suffix - 1]
+            and starts[hi - suffix - 1] + delta == new_starts[n_new - suffix - 1]
+            and ends[hi - suffix - 1] + delta == new_ends[n_new - suffix - 1]
+        ):
+            suffix += 1
+        removed = slice(lo + prefix, hi - suffix)
+        added = slice(prefix, n_new - suffix)
+        diff = SegmentationDiff(
+            index=lo + prefix,
+            removed=list(zip(words[removed], zip(starts[removed], ends[removed]))),
+            added=list(zip(new_words[added], zip(new_starts[added], new_ends[added]))),
+        )
+
+        words[lo:hi] = new_words
+        starts[lo:hi] = new_starts
+        ends[lo:hi] = new_ends
+        self._gap = lo + n_new
+        self._text = new_text
+        return diff
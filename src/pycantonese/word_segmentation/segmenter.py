@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import os
 import re
-from functools import lru_cache
-from itertools import chain
-from typing import Literal, overload, Sequence
+from array import array
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import Iterable, Literal, overload, Sequence
 
 from rustling.seq_feature import seq_obs
 from rustling.wordseg import DAGHMMSegmenter
 
+from pycantonese._parallel import _IS_WASM, _get_n_workers, _parallel_imap
 from pycantonese._punctuation_marks import _PUNCTUATION_MARKS
 from pycantonese.corpus import hkcancor
-from pycantonese.data.rime_cantonese import CHARS_TO_JYUTPING
+from pycantonese.data import rime_cantonese
 from pycantonese.util import _NOT_CANTONESE, _split_chars_with_alphanum
 
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +21,26 @@ _MODEL_PATH = os.path.join(_THIS_DIR, "segmenter.fb.zst")
 
 _WHITESPACE_AROUND_ALPHANUM_REGEX = re.compile(r"(?<=[a-z0-9-])\s+|\s+(?=[a-z0-9-])")
 
+_DEFAULT_BATCH_SIZE = 1000
+
+# Unicode Private Use Area blocks: the one in the Basic Multilingual Plane,
+# followed by Supplementary Private Use Area-A and -B.
+_PUA_RANGES = ((0xE000, 0xF8FF), (0xF0000, 0xFFFFD), (0x100000, 0x10FFFD))
+
+
+# The key that marks the end of a word in the user dictionary trie.
+# Trie keys are otherwise non-empty tokens from _split_chars_with_alphanum().
+_TRIE_END = ""
+
+
+def _get_pua_char(index):
+    """Return the *index*-th Private Use Area character."""
+    for start, end in _PUA_RANGES:
+        if index <= end - start:
+            return chr(start + index)
+        index -= end - start + 1
+    raise ValueError("ran out of Private Use Area characters")
+
 
 class _Segmenter(DAGHMMSegmenter):
     """A word segmentation model.
@@ -54,7 +76,7 @@ class _Segmenter(DAGHMMSegmenter):
         words = set()
         for utterance in hkcancor().words(by_utterance=True):
             words.update(utterance)
-        words |= CHARS_TO_JYUTPING.keys()
+        words |= rime_cantonese.CHARS_TO_JYUTPING.keys()
 
         # Build PUA mapping: each unique alphanumeric sequence gets a single
         # Private Use Area character. This makes English words atomic (1 char)
@@ -67,35 +89,163 @@ class _Segmenter(DAGHMMSegmenter):
         for word in sorted(words):
             for token in _split_chars_with_alphanum(word):
                 if token[0] in _NOT_CANTONESE and token not in self._alphanum_to_pua:
-                    pua = chr(0xE000 + len(self._alphanum_to_pua))
+                    pua = _get_pua_char(len(self._alphanum_to_pua))
                     self._alphanum_to_pua[token] = pua
                     self._pua_to_alphanum[pua] = token
 
-    def _encode(self, text):
-        """Replace alphanumeric sequences with PUA characters."""
-        tokens = _split_chars_with_alphanum(text)
+        self._user_words = set()
+        self._user_words_trie = {}
+
+    def _encode(self, text, unseen=None):
+        """Replace alphanumeric sequences with PUA characters.
+
+        Args:
+            text (str): The text to encode.
+            unseen (dict[str, str], optional): PUA assignments for alphanumeric
+                sequences not in the model's PUA mapping, scoped to
+                the current request. If not provided, such sequences are
+                added to the model's PUA mapping (as done at training time).
+        """
         result = []
-        for t in tokens:
-            if t[0] in _NOT_CANTONESE:
-                if t not in self._alphanum_to_pua:
-                    pua = chr(0xE000 + len(self._alphanum_to_pua))
-                    self._alphanum_to_pua[t] = pua
-                    self._pua_to_alphanum[pua] = t
-                result.append(self._alphanum_to_pua[t])
-            else:
+        for t in _split_chars_with_alphanum(text):
+            if t[0] not in _NOT_CANTONESE:
                 result.append(t)
+            elif (pua := self._alphanum_to_pua.get(t)) is not None:
+                result.append(pua)
+            elif unseen is None:
+                pua = _get_pua_char(len(self._alphanum_to_pua))
+                self._alphanum_to_pua[t] = pua
+                self._pua_to_alphanum[pua] = t
+                result.append(pua)
+            else:
+                if (pua := unseen.get(t)) is None:
+                    pua = _get_pua_char(len(self._alphanum_to_pua) + len(unseen))
+                    unseen[t] = pua
+                result.append(pua)
         return "".join(result)
 
-    def _decode(self, text):
-        """Replace PUA characters back with original alphanumeric sequences."""
+    def _decode(self, text, unseen_pua=None):
+        """Replace PUA characters back with original alphanumeric sequences.
+
+        Args:
+            text (str): The text to decode.
+            unseen_pua (dict[str, str], optional): The reverse mapping of
+                the request-scoped ``unseen`` assignments from :meth:`_encode`.
+        """
+        if unseen_pua:
+            return "".join(
+                self._pua_to_alphanum.get(c) or unseen_pua.get(c, c) for c in text
+            )
         return "".join(self._pua_to_alphanum.get(c, c) for c in text)
 
     def predict(self, sents):
-        """Segment sentences."""
-        encoded = [self._encode(s) for s in sents]
+        """Segment sentences.
+
+        The model's PUA mapping is only read here, never modified,
+        so that memory stays flat and concurrent calls are safe.
+        Alphanumeric sequences unseen at training time get PUA characters
+        that are only valid for this call.
+        """
+        if not self._user_words:
+            yield from self._predict_with_model(sents)
+            return
+
+        # Words from the user dictionary are kept as they are,
+        # and only the text between them goes to the model.
+        chunks_per_sent = [self._split_user_words(s) for s in sents]
+        segmented = iter(
+            self._predict_with_model(
+                [
+                    chunk
+                    for chunks in chunks_per_sent
+                    for chunk, is_user in chunks
+                    if not is_user
+                ]
+            )
+        )
+        for chunks in chunks_per_sent:
+            words = []
+            for chunk, is_user_word in chunks:
+                if is_user_word:
+                    words.append(chunk)
+                else:
+                    words.extend(next(segmented))
+            yield words
+
+    def _predict_with_model(self, sents):
+        """Segment sentences with the model alone."""
+        unseen = {}
+        encoded = [self._encode(s, unseen) for s in sents]
+        unseen_pua = {v: k for k, v in unseen.items()}
         results = super().predict(encoded)
         for sent in results:
-            yield [self._decode(word) for word in sent]
+            yield [self._decode(word, unseen_pua) for word in sent]
+
+    def _split_user_words(self, text):
+        """Split text into chunks at the longest matches of user words.
+
+        Returns:
+            list[tuple[str, bool]]: Each chunk with whether it's a user word.
+        """
+        tokens = _split_chars_with_alphanum(text)
+        n_tokens = len(tokens)
+        chunks = []
+        i = gap_start = 0
+        while i < n_tokens:
+            node = self._user_words_trie
+            match_end = 0
+            j = i
+            while j < n_tokens and (node := node.get(tokens[j])) is not None:
+                j += 1
+                if _TRIE_END in node:
+                    match_end = j
+            if match_end:
+                if gap_start < i:
+                    chunks.append(("".join(tokens[gap_start:i]), False))
+                chunks.append(("".join(tokens[i:match_end]), True))
+                i = gap_start = match_end
+            else:
+                i += 1
+        if gap_start < n_tokens:
+            chunks.append(("".join(tokens[gap_start:]), False))
+        return chunks
+
+    def add_words(self, words):
+        """Add words to the user dictionary.
+
+        Args:
+            words (Iterable[str]): Words to add.
+        """
+        for word in words:
+            if not word or word in self._user_words:
+                continue
+            node = self._user_words_trie
+            for token in _split_chars_with_alphanum(word):
+                node = node.setdefault(token, {})
+            node[_TRIE_END] = True
+            self._user_words.add(word)
+
+    def remove_words(self, words):
+        """Remove words from the user dictionary.
+
+        Args:
+            words (Iterable[str]): Words to remove. Words not in the user
+                dictionary are ignored.
+        """
+        for word in words:
+            if word not in self._user_words:
+                continue
+            tokens = _split_chars_with_alphanum(word)
+            path = [self._user_words_trie]
+            for token in tokens:
+                path.append(path[-1][token])
+            del path[-1][_TRIE_END]
+            # Prune the nodes that no longer lead to any word.
+            for depth in range(len(tokens), 0, -1):
+                if path[depth]:
+                    break
+                del path[depth - 1][tokens[depth - 1]]
+            self._user_words.discard(word)
 
     def fit_unsegmented(self, sent_strs: Sequence[str]):
         """Refine the model with unsupervised EM on unsegmented sentences.
@@ -124,6 +274,14 @@ class _Segmenter(DAGHMMSegmenter):
         self._pua_to_alphanum = {v: k for k, v in self._alphanum_to_pua.items()}
 
 
+@lru_cache(maxsize=1)
+def _get_mixed_script_words() -> frozenset[str]:
+    # Only the known words with an English-CJK boundary matter for
+    # _split_script_boundary(), so the default segmenter doesn't have to
+    # load the entire rime-cantonese CHARS_TO_JYUTPING.
+    return frozenset(rime_cantonese.MIXED_SCRIPT_WORDS)
+
+
 @lru_cache(maxsize=1)
 def _get_default_segmenter():
     # Call __new__ to create the Rust DAGHMMSegmenter base object,
@@ -132,17 +290,20 @@ def _get_default_segmenter():
     segmenter = _Segmenter.__new__(_Segmenter)
     segmenter._alphanum_to_pua = {}
     segmenter._pua_to_alphanum = {}
+    segmenter._user_words = set()
+    segmenter._user_words_trie = {}
     segmenter.load(_MODEL_PATH)
     return segmenter
 
 
-def _split_script_boundary(word):
+def _split_script_boundary(word, mixed_script_words, user_words):
     """Split a word at English-CJK boundaries, preserving known mixed words.
 
     For example, "course超" becomes ["course", "超"], but "IQ題" stays as
     ["IQ題"] because it is a known word in CHARS_TO_JYUTPING.
+    Words in *mixed_script_words* or *user_words* aren't split.
     """
-    if len(word) <= 1 or word in CHARS_TO_JYUTPING:
+    if len(word) <= 1 or word in mixed_script_words or word in user_words:
         return [word]
     result = []
     current = word[0]
@@ -180,52 +341,151 @@ def _split_punct(word):
     return result
 
 
-def _segment_with_offsets(
-    unsegmented: str,
-) -> list[tuple[str, tuple[int, int]]]:
-    """Segment and return words with character offsets into the original string."""
-    if not unsegmented:
-        return []
-    segmenter = _get_default_segmenter()
+def _get_parts(unsegmented: str) -> list[str]:
+    """Split the input at whitespace around alphanumeric tokens.
+
+    Spaces within each part are removed, and empty parts are dropped.
+    """
+    parts = _WHITESPACE_AROUND_ALPHANUM_REGEX.split(unsegmented.strip())
+    return [compact for part in parts if (compact := part.replace(" ", ""))]
+
+
+def _get_parts_with_spans(unsegmented: str) -> list[tuple[str, str, int]]:
+    """Split the input like :func:`_get_parts`, keeping track of the spans.
+
+    Each part is a ``(compact, part, part_start)`` tuple, where *compact* is
+    *part* with spaces removed, and *part* starts at *part_start* in the input.
+    """
     stripped = unsegmented.strip()
     strip_offset = unsegmented.index(stripped[0]) if stripped else 0
-    result: list[tuple[str, tuple[int, int]]] = []
     # Split by whitespace around alphanumeric tokens, tracking spans.
     pos = 0
-    parts: list[tuple[str, int]] = []
+    spans: list[tuple[str, int]] = []
     for m in _WHITESPACE_AROUND_ALPHANUM_REGEX.finditer(stripped):
         if m.start() > pos:
-            parts.append((stripped[pos : m.start()], strip_offset + pos))
+            spans.append((stripped[pos : m.start()], strip_offset + pos))
         pos = m.end()
     if pos < len(stripped):
-        parts.append((stripped[pos:], strip_offset + pos))
-    if not parts and stripped:
-        parts.append((stripped, strip_offset))
-    for part, part_start in parts:
-        # Remove spaces within each part, tracking original char positions.
-        chars = []
-        char_positions = []
-        for i, ch in enumerate(part):
-            if ch != " ":
-                chars.append(ch)
-                char_positions.append(part_start + i)
-        if not chars:
-            continue
-        compact = "".join(chars)
-        segmented = next(segmenter.predict([compact]))
-        seg_offset = 0
-        for word in segmented:
-            for sub_word in chain.from_iterable(
-                map(_split_script_boundary, _split_punct(word))
-            ):
-                word_len = len(sub_word)
-                start_pos = char_positions[seg_offset]
-                end_pos = char_positions[seg_offset + word_len - 1] + 1
-                result.append((sub_word, (start_pos, end_pos)))
-                seg_offset += word_len
+        spans.append((stripped[pos:], strip_offset + pos))
+    if not spans and stripped:
+        spans.append((stripped, strip_offset))
+    return [
+        (compact, part, part_start)
+        for part, part_start in spans
+        if (compact := part.replace(" ", ""))
+    ]
+
+
+def _split_words(words, split_script_boundary):
+    """Split punctuation and English-CJK boundaries off the model's output.
+
+    *split_script_boundary* is :func:`_split_script_boundary` with the
+    known mixed-script words and the user words of the batch filled in.
+    """
+    return chain.from_iterable(
+        map(split_script_boundary, chain.from_iterable(map(_split_punct, words)))
+    )
+
+
+def _iter_word_offsets(words, part: str, part_start: int):
+    """Yield ``(word, start, end)`` for the words of a segmented part.
+
+    The offsets are computed in a single pass over *part*, skipping the spaces
+    that were removed before the part went to the model.
+    """
+    if " " not in part:
+        start = part_start
+        for word in words:
+            end = start + len(word)
+            yield word, start, end
+            start = end
+        return
+    i = 0
+    for word in words:
+        while part[i] == " ":
+            i += 1
+        start = i
+        n_chars_left = len(word)
+        while n_chars_left:
+            if part[i] != " ":
+                n_chars_left -= 1
+            i += 1
+        yield word, part_start + start, part_start + i
+
+
+def _segment_batch(
+    unsegmented_texts: Sequence[str], offsets: bool | Literal["array"]
+) -> list:
+    """Segment a batch of inputs with a single call to the model."""
+    all_parts: list[str] = []
+    all_spans: list[tuple[str, int]] = []
+    n_parts_per_text = []
+    for text in unsegmented_texts:
+        if not text:
+            n_parts_per_text.append(0)
+        elif offsets:
+            parts = _get_parts_with_spans(text)
+            n_parts_per_text.append(len(parts))
+            for compact, part, part_start in parts:
+                all_parts.append(compact)
+                all_spans.append((part, part_start))
+        else:
+            parts = _get_parts(text)
+            n_parts_per_text.append(len(parts))
+            all_parts.extend(parts)
+
+    segmenter = _get_default_segmenter()
+    segmented = segmenter.predict(all_parts) if all_parts else iter(())
+    # Look up the words not to split once for the batch, instead of per word.
+    split_script_boundary = partial(
+        _split_script_boundary,
+        mixed_script_words=_get_mixed_script_words(),
+        user_words=segmenter._user_words,
+    )
+
+    result: list = []
+    i = 0
+    for n_parts in n_parts_per_text:
+        if offsets == "array":
+            words: list[str] = []
+            starts = array("l")
+            ends = array("l")
+            for _ in range(n_parts):
+                for word, start, end in _iter_word_offsets(
+                    _split_words(next(segmented), split_script_boundary), *all_spans[i]
+                ):
+                    words.append(word)
+                    starts.append(start)
+                    ends.append(end)
+                i += 1
+            result.append((words, starts, ends))
+        elif offsets:
+            words_with_offsets: list[tuple[str, tuple[int, int]]] = []
+            for _ in range(n_parts):
+                for word, start, end in _iter_word_offsets(
+                    _split_words(next(segmented), split_script_boundary), *all_spans[i]
+                ):
+                    words_with_offsets.append((word, (start, end)))
+                i += 1
+            result.append(words_with_offsets)
+        else:
+            words = []
+            for _ in range(n_parts):
+                words.extend(_split_words(next(segmented), split_script_boundary))
+                i += 1
+            result.append(words)
     return result
 
 
+def _segment_with_offsets(
+    unsegmented: str,
+) -> list[tuple[str, tuple[int, int]]]:
+    """Segment and return words with character offsets into the original string."""
+    if not unsegmented:
+        return []
+    return _segment_batch([unsegmented], offsets=True)[0]
+
+
 @overload
 def segment(unsegmented: str, *, offsets: Literal[False] = False) -> list[str]: ...
 
@@ -236,9 +496,15 @@ def segment(
 ) -> list[tuple[str, tuple[int, int]]]: ...
 
 
+@overload
+def segment(
+    unsegmented: str, *, offsets: Literal["array"]
+) -> tuple[list[str], array, array]: ...
+
+
 def segment(
-    unsegmented: str, *, offsets: bool = False
-) -> list[str] | list[tuple[str, tuple[int, int]]]:
+    unsegmented: str, *, offsets: bool | Literal["array"] = False
+) -> list[str] | list[tuple[str, tuple[int, int]]] | tuple[list[str], array, array]:
     """Segment the unsegmented input.
 
     The word segmentation model is a Jieba-styled DAG+HMM hybrid segmenter,
@@ -247,13 +513,21 @@ def segment(
 
     Args:
         unsegmented (str): Unsegmented input.
-        offsets (bool, optional): If True, return each word as a
+        offsets (bool or str, optional): If True, return each word as a
             ``(word, (start, end))`` tuple where *start* and *end* are
             character offsets into the original *unsegmented* string
-            (exclusive end, like Python slices). Defaults to False.
+            (exclusive end, like Python slices). If ``"array"``,
+            return a ``(words, starts, ends)`` tuple instead,
+            where *starts* and *ends* are :class:`array.array` objects
+            of type ``"l"`` holding the offsets of the words, which is more
+            compact for long inputs. Defaults to False.
+
+            .. versionchanged:: 4.3.0
+                Added the ``"array"`` option.
 
     Returns:
         list[str] or list[tuple[str, tuple[int, int]]]
+        or tuple[list[str], array.array, array.array]
 
     Examples:
         >>> segment("廣東話容唔容易學？")  # "Is Cantonese easy to learn?"
@@ -261,24 +535,250 @@ def segment(
         >>> segment("廣東話容唔容易學？", offsets=True)
         [('廣東話', (0, 3)), ('容', (3, 4)), ('唔', (4, 5)),
          ('容易', (5, 7)), ('學', (7, 8)), ('？', (8, 9))]
+        >>> segment("廣東話容唔容易學？", offsets="array")
+        (['廣東話', '容', '唔', '容易', '學', '？'],
+         array('l', [0, 3, 4, 5, 7, 8]), array('l', [3, 4, 5, 7, 8, 9]))
     """
-    if offsets:
-        return _segment_with_offsets(unsegmented)
+    if offsets == "array":
+        # The arrays are mutable, so this option bypasses the result cache.
+        return _segment_batch([unsegmented], offsets="array")[0]
     if not unsegmented:
         return []
+    if (cached_segment := _cached_segment) is not None:
+        return list(cached_segment(unsegmented, offsets))
+    if offsets:
+        return _segment_with_offsets(unsegmented)
+    return _segment_batch([unsegmented], offsets=False)[0]
+
+
+def _segment_for_cache(unsegmented: str, offsets: bool) -> tuple:
+    """Segment the input, returning an immutable result for caching."""
+    return tuple(_segment_batch([unsegmented], offsets=offsets)[0])
+
+
+# The LRU-cached version of _segment_for_cache(), or None if disabled.
+_cached_segment = None
+
+
+def set_segment_cache(maxsize: int | None = 1024) -> None:
+    """Enable, resize, or disable the result cache of :func:`~pycantonese.segment`.
+
+    The cache is disabled by default. When enabled, :func:`~pycantonese.segment`
+    returns the cached result of a previously seen input (keyed by the input
+    string and the ``offsets`` argument), skipping the word segmentation model.
+    The least recently used result is evicted when the cache is full.
+    The cache is safe to share across threads.
+    Calling this function discards any previously cached results.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        maxsize (int or None, optional): The maximum number of cached results.
+            If ``0``, the cache is disabled. If ``None``, the cache can grow
+            without bound. Defaults to 1024.
+
+    Examples:
+        >>> set_segment_cache(10_000)
+        >>> segment("廣東話容唔容易學？")
+        ['廣東話', '容', '唔', '容易', '學', '？']
+        >>> segment_cache_info()
+        CacheInfo(hits=0, misses=1, maxsize=10000, currsize=1)
+        >>> set_segment_cache(0)  # Disable the cache.
+    """
+    global _cached_segment
+    if maxsize == 0:
+        _cached_segment = None
+    else:
+        _cached_segment = lru_cache(maxsize=maxsize)(_segment_for_cache)
+
+
+def segment_cache_info():
+    """Return the statistics of the result cache of :func:`~pycantonese.segment`.
+
+    .. versionadded:: 4.3.0
+
+    Returns:
+        functools._CacheInfo or None: A named tuple of ``hits``, ``misses``,
+        ``maxsize``, and ``currsize``, like that of
+        :func:`functools.lru_cache`, or ``None`` if the cache is disabled.
+    """
+    if (cached_segment := _cached_segment) is None:
+        return None
+    return cached_segment.cache_info()
+
+
+def segment_cache_clear() -> None:
+    """Clear the result cache and statistics of :func:`~pycantonese.segment`.
+
+    .. versionadded:: 4.3.0
+    """
+    if (cached_segment := _cached_segment) is not None:
+        cached_segment.cache_clear()
+
+
+def _init_worker(user_words: list[str]) -> None:
+    """Load the word segmenter in a worker process and add the user words.
+
+    The user words are passed in instead of the segmenter itself, as the
+    segmenter can't be pickled for workers that aren't forked.
+    Words already in the user dictionary are skipped.
+    """
     segmenter = _get_default_segmenter()
-    parts_to_segment = map(
-        lambda x: x.replace(" ", ""),
-        _WHITESPACE_AROUND_ALPHANUM_REGEX.split(unsegmented.strip()),
-    )
-    words = chain.from_iterable(
-        map(lambda x: next(segmenter.predict([x])), parts_to_segment)
-    )
-    return list(
-        chain.from_iterable(
-            map(
-                _split_script_boundary,
-                chain.from_iterable(map(_split_punct, words)),
-            )
-        )
-    )
+    if user_words:
+        segmenter.add_words(user_words)
+
+
+def _iter_batches(items: Iterable, batch_size: int):
+    """Yield lists of up to *batch_size* consecutive items."""
+    items = iter(items)
+    while batch := list(islice(items, batch_size)):
+        yield batch
+
+
+@overload
+def segment_many(
+    unsegmented_texts: Iterable[str],
+    *,
+    offsets: Literal[False] = False,
+    batch_size: int = ...,
+    n_jobs: int | None = ...,
+) -> list[list[str]]: ...
+
+
+@overload
+def segment_many(
+    unsegmented_texts: Iterable[str],
+    *,
+    offsets: Literal[True],
+    batch_size: int = ...,
+    n_jobs: int | None = ...,
+) -> list[list[tuple[str, tuple[int, int]]]]: ...
+
+
+@overload
+def segment_many(
+    unsegmented_texts: Iterable[str],
+    *,
+    offsets: Literal["array"],
+    batch_size: int = ...,
+    n_jobs: int | None = ...,
+) -> list[tuple[list[str], array, array]]: ...
+
+
+def segment_many(
+    unsegmented_texts: Iterable[str],
+    *,
+    offsets: bool | Literal["array"] = False,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    n_jobs: int | None = None,
+) -> (
+    list[list[str]]
+    | list[list[tuple[str, tuple[int, int]]]]
+    | list[tuple[list[str], array, array]]
+):
+    """Segment many unsegmented inputs.
+
+    The result is the same as calling :func:`~pycantonese.segment` on each
+    input, but the inputs are sent to the word segmentation model in batches,
+    which avoids the per-call overhead for large numbers of short inputs.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        unsegmented_texts (Iterable[str]): Unsegmented inputs.
+        offsets (bool or str, optional): If True or ``"array"``, return
+            the character offsets of the words, as in
+            :func:`~pycantonese.segment`. Defaults to False.
+        batch_size (int, optional): The number of inputs sent to the model
+            in one call. Defaults to 1000.
+        n_jobs (int, optional): The number of worker processes that segment
+            batches in parallel. If ``-1``, all CPU cores are used.
+            If not provided, all batches are segmented in the current process.
+            The output order is the same regardless of this argument.
+            Parallelization is not available in Pyodide, where this argument
+            is ignored.
+
+    Returns:
+        list[list[str]] or list[list[tuple[str, tuple[int, int]]]]
+        or list[tuple[list[str], array.array, array.array]]:
+        The segmented inputs, in the same order as *unsegmented_texts*.
+
+    Raises:
+        ValueError: If *batch_size* is not a positive integer,
+            or if *n_jobs* is neither a positive integer nor ``-1``.
+
+    Examples:
+        >>> segment_many(["廣東話容唔容易學？", "我今晚會 have dinner"])
+        [['廣東話', '容', '唔', '容易', '學', '？'],
+         ['我', '今晚', '會', 'have', 'dinner']]
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer: {batch_size}")
+    n_workers = _get_n_workers(n_jobs)
+    batches = _iter_batches(unsegmented_texts, batch_size)
+    result: list = []
+    if n_workers > 1 and not _IS_WASM:
+        for segmented in _parallel_imap(
+            partial(_segment_batch, offsets=offsets),
+            batches,
+            initializer=_init_worker,
+            initargs=(list(_get_default_segmenter()._user_words),),
+            max_workers=n_workers,
+        ):
+            result.extend(segmented)
+    else:
+        for batch in batches:
+            result.extend(_segment_batch(batch, offsets=offsets))
+    return result
+
+
+def add_words(words: Iterable[str]) -> None:
+    """Add words to the user dictionary of the word segmenter.
+
+    :func:`~pycantonese.segment` and :func:`~pycantonese.segment_many`
+    always keep a word in the user dictionary as a single word.
+    Where user words overlap in the input, the longest one starting
+    from the left wins.
+    The word segmentation model itself is unchanged, and
+    the rest of the input is segmented as usual.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        words (Iterable[str]): Words to add, e.g., shop names or slang.
+
+    Examples:
+        >>> add_words(["鴨寮街"])
+        >>> segment("去鴨寮街")
+        ['去', '鴨寮街']
+    """
+    _get_default_segmenter().add_words(words)
+    segment_cache_clear()
+
+
+def remove_words(words: Iterable[str]) -> None:
+    """Remove words from the user dictionary of the word segmenter.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        words (Iterable[str]): Words to remove. Words not in the user
+            dictionary are ignored.
+    """
+    _get_default_segmenter().remove_words(words)
+    segment_cache_clear()
+
+
+def load_user_dict(path: str | os.PathLike[str]) -> None:
+    """Add the words from a file to the user dictionary of the word segmenter.
+
+    .. versionadded:: 4.3.0
+
+    Args:
+        path (str or os.PathLike[str]): Path to a UTF-8 text file with
+            one word per line. Anything after the word and a whitespace
+            on the same line (e.g., a frequency count or a part-of-speech tag,
+            as in a Jieba user dictionary) is ignored, and so are blank lines.
+    """
+    with open(path, encoding="utf8") as f:
+        add_words([fields[0] for line in f if (fields := line.split())])
@@ -7,6 +7,7 @@ use rustling::chat::{
 };
 use rustling::ngram::{BaseNgrams, Ngrams, PyNgrams};
 use std::collections::{HashMap, HashSet, VecDeque};
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{LazyLock, Mutex};
 
 type PyObject = Py<PyAny>;
@@ -555,6 +556,8 @@ fn chat_error_to_pyerr(e: ChatError) -> pyo3::PyErr {
 
 type TokenCache = Vec<Vec<Vec<Py<Token>>>>;
 type JyutpingCache = Vec<Vec<Vec<Option<String>>>>;
+/// Romanizations converted from the jyutping cache, by scheme name.
+type RomanizationCache = HashMap<String, JyutpingCache>;
 
 /// A reader for Cantonese CHAT corpus data.
 ///
@@ -570,6 +573,12 @@ pub struct Chat {
     token_cache: Mutex<Option<TokenCache>>,
     /// Cached jyutping values: [file_idx][utt_idx][tok_idx].
     jyutping_cache: Mutex<Option<JyutpingCache>>,
+    /// Cached romanizations (Yale, IPA, etc.) of the jyutping values,
+    /// in the same layout as the jyutping cache.
+    romanization_cache: Mutex<RomanizationCache>,
+    /// Incremented whenever the caches are invalidated, so that a conversion
+    /// started before an invalidation isn't stored in the romanization cache.
+    cache_generation: AtomicU64,
 }
 
 impl Chat {
@@ -651,6 +660,91 @@ impl Chat {
         *self.utterance_cache.lock().unwrap() = None;
         *self.token_cache.lock().unwrap() = None;
         *self.jyutping_cache.lock().unwrap() = None;
+        let mut romanizations = self.romanization_cache.lock().unwrap();
+        romanizations.clear();
+        self.cache_generation.fetch_add(1, Ordering::SeqCst);
+    }
+
+    /// Convert the jyutping cache into a romanization with `converter`.
+    ///
+    /// `converter` is called once, with the list of the distinct jyutping
+    /// values, and returns the list of their romanizations (`None` for
+    /// a value that can't be converted).
+    fn convert_jyutping_cache(
+        &self,
+        py: Python<'_>,
+        converter: &Bound<'_, PyAny>,
+    ) -> PyResult<JyutpingCache> {
+        self.ensure_jyutping_cache(py)?;
+        // Replace each jyutping value by the index of its distinct value,
+        // without holding the lock while calling back into Python.
+        let mut distinct: Vec<String> = Vec::new();
+        let indices: Vec<Vec<Vec<Option<usize>>>> = {
+            let guard = self.jyutping_cache.lock().unwrap();
+            let cached = guard.as_ref().unwrap();
+            let mut index_of: HashMap<&str, usize> = HashMap::new();
+            cached
+                .iter()
+                .map(|file| {
+                    file.iter()
+                        .map(|utt| {
+                            utt.iter()
+                                .map(|jp| {
+                                    jp.as_deref().map(|jp| {
+                                        *index_of.entry(jp).or_insert_with(|| {
+                                            distinct.push(jp.to_string());
+                                            distinct.len() - 1
+                                        })
+                                    })
+                                })
+                                .collect()
+                        })
+                        .collect()
+                })
+                .collect()
+        };
+        let converted: Vec<Option<String>> = converter.call1((distinct,))?.extract()?;
+        Ok(indices
+            .iter()
+            .map(|file| {
+                file.iter()
+                    .map(|utt| {
+                        utt.iter()
+                            .map(|i| i.and_then(|i| converted.get(i).cloned().flatten()))
+                            .collect()
+                    })
+                    .collect()
+            })
+            .collect())
+    }
+}
+
+/// Convert cached values per token to Python lists, grouped as requested.
+fn nested_to_pyobject(
+    py: Python<'_>,
+    cached: &JyutpingCache,
+    by_utterance: bool,
+    by_file: bool,
+) -> PyResult<PyObject> {
+    if by_file && by_utterance {
+        Ok(cached.into_pyobject(py)?.into_any().unbind())
+    } else if by_utterance {
+        let result: Vec<&Vec<Option<String>>> =
+            cached.iter().flat_map(|file| file.iter()).collect();
+        Ok(result.into_pyobject(py)?.into_any().unbind())
+    } else if by_file {
+        let result: Vec<Vec<&Option<String>>> = cached
+            .iter()
+            .map(|file| file.iter().flat_map(|utt| utt.iter()).collect())
+            .collect();
+        Ok(result.into_pyobject(py)?.into_any().unbind())
+    } else {
+        let result: Vec<&Option<String>> = cached
+            .iter()
+            .flat_map(|file| file.iter())
+            .flat_map(|utt| utt.iter())
+            .collect();
+        Ok(result.into_pyobject(py)?.into_any().unbind())
     }
 }
 
@@ -667,6 +761,8 @@ impl BaseChat for Chat {
             utterance_cache: Mutex::new(None),
             token_cache: Mutex::new(None),
             jyutping_cache: Mutex::new(None),
+            romanization_cache: Mutex::new(HashMap::new()),
+            cache_generation: AtomicU64::new(0),
         }
     }
 }
@@ -711,6 +807,8 @@ impl Chat {
             utterance_cache: Mutex::new(None),
             token_cache: Mutex::new(None),
             jyutping_cache: Mutex::new(None),
+            romanization_cache: Mutex::new(HashMap::new()),
+            cache_generation: AtomicU64::new(0),
         };
         result.ensure_jyutping_cache(py)?;
         Ok(result)
@@ -739,6 +837,8 @@ impl Chat {
             utterance_cache: Mutex::new(None),
             token_cache: Mutex::new(None),
             jyutping_cache: Mutex::new(None),
+            romanization_cache: Mutex::new(HashMap::new()),
+            cache_generation: AtomicU64::new(0),
         };
         result.ensure_jyutping_cache(py)?;
         Ok(result)
@@ -775,6 +875,8 @@ impl Chat {
             utterance_cache: Mutex::new(None),
             token_cache: Mutex::new(None),
             jyutping_cache: Mutex::new(None),
+            romanization_cache: Mutex::new(HashMap::new()),
+            cache_generation: AtomicU64::new(0),
         };
         result.ensure_jyutping_cache(py)?;
         Ok(result)
@@ -811,6 +913,8 @@ impl Chat {
             utterance_cache: Mutex::new(None),
             token_cache: Mutex::new(None),
             jyutping_cache: Mutex::new(None),
+            romanization_cache: Mutex::new(HashMap::new()),
+            cache_generation: AtomicU64::new(0),
         };
         result.ensure_jyutping_cache(py)?;
         Ok(result)
@@ -881,27 +985,38 @@ impl Chat {
     fn jyutping(&self, py: Python<'_>, by_utterance: bool, by_file: bool) -> PyResult<PyObject> {
         self.ensure_jyutping_cache(py)?;
         let guard = self.jyutping_cache.lock().unwrap();
-        let cached = guard.as_ref().unwrap();
-        if by_file && by_utterance {
-            Ok(cached.into_pyobject(py)?.into_any().unbind())
-        } else if by_utterance {
-            let result: Vec<&Vec<Option<String>>> =
-                cached.iter().flat_map(|file| file.iter()).collect();
-            Ok(result.into_pyobject(py)?.into_any().unbind())
-        } else if by_file {
-            let result: Vec<Vec<&Option<String>>> = cached
-                .iter()
-                .map(|file| file.iter().flat_map(|utt| utt.iter()).collect())
-                .collect();
-            Ok(result.into_pyobject(py)?.into_any().unbind())
-        } else {
-            let result: Vec<&Option<String>> = cached
-                .iter()
-                .flat_map(|file| file.iter())
-                .flat_map(|utt| utt.iter())
-                .collect();
-            Ok(result.into_pyobject(py)?.into_any().unbind())
+        nested_to_pyobject(py, guard.as_ref().unwrap(), by_utterance, by_file)
+    }
+
+    /// Return the Jyutping of all tokens converted into another romanization.
+    ///
+    /// The conversion is cached by `scheme` until the data changes, and
+    /// `converter` is only called (once) when `scheme` isn't in the cache.
+    #[pyo3(signature = (scheme, converter, *, by_utterance=false, by_file=false))]
+    fn romanization(
+        &self,
+        py: Python<'_>,
+        scheme: &str,
+        converter: &Bound<'_, PyAny>,
+        by_utterance: bool,
+        by_file: bool,
+    ) -> PyResult<PyObject> {
+        let generation = {
+            let romanizations = self.romanization_cache.lock().unwrap();
+            if let Some(cached) = romanizations.get(scheme) {
+                return nested_to_pyobject(py, cached, by_utterance, by_file);
+            }
+            self.cache_generation.load(Ordering::SeqCst)
+        };
+        let converted = self.convert_jyutping_cache(py, converter)?;
+        let result = nested_to_pyobject(py, &converted, by_utterance, by_file);
+        // The lock isn't held during the conversion, so the data may have
+        // changed in the meantime, in which case the result is stale.
+        let mut romanizations = self.romanization_cache.lock().unwrap();
+        if self.cache_generation.load(Ordering::SeqCst) == generation {
+            romanizations.insert(scheme.to_string(), converted);
         }
+        result
     }
 
     /// Return preprocessed utterances.
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 import pycantonese
 from pycantonese.corpus import CHAT, Token, Utterance
 
@@ -97,3 +99,49 @@ def test_from_utterances_empty():
     reader = CHAT.from_utterances([])
     assert reader.words() == []
     assert reader.utterances() == []
+
+
+_CHAT_STR = (
+    "@UTF8\n@Begin\n@Participants:\tXXA A\n"
+    "*XXA:\t喂 氣候 .\n%mor:\te|wai3 n|hei3hau6 .\n@End\n"
+)
+
+
+def test_romanization():
+    jyutping = _HKCANCOR.jyutping()
+    for scheme, convert in [
+        ("yale", pycantonese.jyutping_to_yale),
+        ("ipa", pycantonese.jyutping_to_ipa),
+    ]:
+        romanization = _HKCANCOR.romanization(scheme)
+        assert len(romanization) == len(jyutping)
+        assert romanization[0] == convert(jyutping[0], return_as="string")
+
+
+@pytest.mark.parametrize("by_utterance", [False, True])
+@pytest.mark.parametrize("by_file", [False, True])
+def test_romanization_grouping(by_utterance, by_file):
+    jyutping = _HKCANCOR.jyutping(by_utterance=by_utterance, by_file=by_file)
+    romanization = _HKCANCOR.romanization(
+        "tipa", by_utterance=by_utterance, by_file=by_file
+    )
+    assert len(romanization) == len(jyutping)
+    assert len(romanization[-1]) == len(jyutping[-1])
+
+
+def test_romanization_none_without_jyutping():
+    reader = CHAT.from_strs([_CHAT_STR], strict=False)
+    assert reader.jyutping() == ["wai3", "hei3hau6", None]
+    assert reader.romanization("yale") == ["wai", "hei'hauh", None]
+
+
+def test_romanization_updated_after_append():
+    reader = CHAT.from_strs([_CHAT_STR], strict=False)
+    assert len(reader.romanization("yale")) == 3
+    reader.append(CHAT.from_strs([_CHAT_STR], strict=False))
+    assert reader.romanization("yale") == ["wai", "hei'hauh", None] * 2
+
+
+def test_romanization_invalid_scheme():
+    with pytest.raises(ValueError):
+        _HKCANCOR.romanization("wade-giles")
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import pycantonese
+
+# Generous, so that the test isn't flaky on slow machines. Loading the modules
+# behind the public names (the models, the corpus reader, etc.) takes far longer.
+_IMPORT_TIME_BUDGET_US = 50_000
+
+_MODULES_NOT_TO_IMPORT = [
+    "concurrent.futures",
+    "multiprocessing",
+    "rustling",
+    "pycantonese._rust",
+    "pycantonese.corpus",
+    "pycantonese.data.rime_cantonese",
+    "pycantonese.jyutping",
+    "pycantonese.parsing",
+    "pycantonese.pos_tagging",
+    "pycantonese.word_segmentation",
+]
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time():
+    # Import once first, so that the timed import doesn't include compiling
+    # the modules to bytecode.
+    _run_python("import pycantonese")
+    stderr = _run_python("import pycantonese", "-X", "importtime").stderr
+    # Each line looks like "import time: <self us> | <cumulative us> | <name>".
+    cumulative_us = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in stderr.splitlines()[1:]
+        if line.startswith("import time:")
+    }
+    assert cumulative_us["pycantonese"] < _IMPORT_TIME_BUDGET_US
+
+
+def test_import_is_lazy():
+    code = "import sys, pycantonese; print(' '.join(sys.modules))"
+    modules = set(_run_python(code).stdout.split())
+    assert "pycantonese" in modules
+    assert not modules & set(_MODULES_NOT_TO_IMPORT)
+
+
+@pytest.mark.parametrize("name", pycantonese.__all__)
+def test_public_names(name):
+    assert getattr(pycantonese, name) is not None
+    assert name in dir(pycantonese)
+
+
+def test_missing_name():
+    with pytest.raises(AttributeError):
+        pycantonese.no_such_name
@@ -1,6 +1,16 @@
 import pytest
 
-from pycantonese import characters_to_jyutping
+from pycantonese import (
+    _parallel,
+    characters_to_jyutping,
+    characters_to_jyutping_many,
+    jyutping_to_characters,
+)
+from pycantonese.jyutping.lexicon import (
+    _build_hkcancor_lexicon,
+    _read_hkcancor_lexicon,
+    _write_hkcancor_lexicon,
+)
 
 
 @pytest.mark.parametrize(
@@ -32,8 +42,90 @@ from pycantonese import characters_to_jyutping
         ),
         ("蛋", [("蛋", "daan2")]),
         ("蛋糕", [("蛋糕", "daan6gou1")]),
+        # Unknown words are romanized by the longest known words within them.
+        (
+            ["香港人講廣東話", "廣東話話", "香港like"],
+            [
+                ("香港人講廣東話", "hoeng1gong2jan4gong2gwong2dung1waa2"),
+                ("廣東話話", "gwong2dung1waa2waa6"),
+                ("香港like", None),
+            ],
+        ),
     ],
 )
 def test_characters_to_jyutping(chars, expected):
     actual = characters_to_jyutping(chars)
     assert actual == expected
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_characters_to_jyutping_many(n_jobs):
+    texts = ["香港人講廣東話。", "", "佢成日呃like", "蛋", "蛋糕"] * 3
+    expected = [characters_to_jyutping(text) for text in texts]
+    actual = characters_to_jyutping_many(iter(texts), batch_size=4, n_jobs=n_jobs)
+    assert list(actual) == expected
+
+
+def test_characters_to_jyutping_many_spawn(monkeypatch):
+    monkeypatch.setattr(_parallel, "_CAN_FORK", False)
+    texts = ["香港人講廣東話。", "佢成日呃like"] * 3
+    expected = [characters_to_jyutping(text) for text in texts]
+    actual = characters_to_jyutping_many(texts, batch_size=2, n_jobs=2)
+    assert list(actual) == expected
+
+
+def test_characters_to_jyutping_many_presegmented():
+    texts = [["香港", "人", "講", "廣東", "話", "。"], [], ["廣東話話"]]
+    expected = [characters_to_jyutping(words) for words in texts]
+    actual = characters_to_jyutping_many(texts, presegmented=True, batch_size=2)
+    assert list(actual) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"n_jobs": 0}])
+def test_characters_to_jyutping_many_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        characters_to_jyutping_many(["廣東話"], **kwargs)
+
+
+@pytest.mark.parametrize(
+    "jyutping, kwargs, expected",
+    [
+        ("gwong2dung1waa2", {}, ["廣東話"]),
+        ("GWONG2DUNG1WAA2", {}, ["廣東話"]),
+        ("gwongdungwaa", {}, ["廣東話"]),
+        ("gwong2dung1", {"prefix": True, "limit": 2}, ["廣東話", "廣東省"]),
+        ("hoeng1gong2", {"prefix": True, "limit": 3}, ["香港", "香港人", "香港區"]),
+        ("si1", {"limit": 3}, ["司", "思", "斯"]),
+        ("m4goi1", {}, ["唔該"]),
+        ("m4goi1", {"limit": 0}, []),
+        ("xyz", {}, []),
+    ],
+)
+def test_jyutping_to_characters(jyutping, kwargs, expected):
+    assert jyutping_to_characters(jyutping, **kwargs) == expected
+
+
+def test_jyutping_to_characters_round_trip():
+    for word, jp in characters_to_jyutping(["香港", "人", "講", "廣東話"]):
+        assert word in jyutping_to_characters(jp)
+
+
+def test_jyutping_to_characters_invalid_limit():
+    with pytest.raises(ValueError):
+        jyutping_to_characters("gwong2", limit=-1)
+
+
+def test_hkcancor_lexicon_is_up_to_date():
+    # If this fails, rebuild the lexicon with `python -m pycantonese.jyutping.lexicon`.
+    assert _read_hkcancor_lexicon() == _build_hkcancor_lexicon()
+
+
+def test_hkcancor_lexicon_round_trip(tmp_path):
+    path = str(tmp_path / "lexicon.tsv.gz")
+    words_to_jyutping = {"廣東話": "gwong2dung1waa2", "人": "jan4"}
+    chars_to_jyutping = {"廣": "gwong2", "東": "dung1"}
+    word_counts = {"廣東話": 10, "人": 300}
+    char_counts = {"廣": 12, "東": 20}
+    lexicon = (words_to_jyutping, chars_to_jyutping, word_counts, char_counts)
+    _write_hkcancor_lexicon(*lexicon, path)
+    assert _read_hkcancor_lexicon(path) == lexicon
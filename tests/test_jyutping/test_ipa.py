@@ -1,6 +1,11 @@
 import pytest
 
-from pycantonese.jyutping.ipa import jyutping_to_ipa
+from pycantonese.jyutping import IPAConverter
+from pycantonese.jyutping.ipa import (
+    ipa_to_jyutping,
+    ipa_to_jyutping_many,
+    jyutping_to_ipa,
+)
 
 
 @pytest.mark.parametrize(
@@ -41,3 +46,67 @@ def test_jyutping_to_ipa__custom_tones():
 
 def test_jyutping_to_ipa__custom_codas():
     assert jyutping_to_ipa("sip3", return_as="string", codas={"p": "p"}) == "sip33"
+
+
+def test_ipa_converter():
+    converter = IPAConverter(onsets={"c": "tʃ'"}, codas={"p": "p"}, tones={"1": "˥"})
+    assert converter.convert("ci1sip3") == ["tʃ'i˥", "sip33"]
+    assert converter.convert("ci1sip3", return_as="string") == "tʃ'i˥ sip33"
+    assert converter.convert("") == []
+
+
+def test_ipa_converter_same_as_jyutping_to_ipa():
+    custom = {"onsets": {"c": "tʃ'"}, "nuclei": {"i": "iː"}, "tones": {"2": "35"}}
+    converter = IPAConverter(**custom)
+    jp_strs = ["ci1", "gwong2dung1waa2", "GEOK3", "m4goi1"]
+    assert converter.convert_many(jp_strs) == [
+        jyutping_to_ipa(jp_str, **custom) for jp_str in jp_strs
+    ]
+    assert converter.convert_many(jp_strs, return_as="string") == [
+        jyutping_to_ipa(jp_str, return_as="string", **custom) for jp_str in jp_strs
+    ]
+
+
+def test_ipa_converter_copies_custom_symbols():
+    onsets = {"c": "tʃ'"}
+    converter = IPAConverter(onsets=onsets)
+    onsets["c"] = "ch"
+    assert converter.convert("ci1") == ["tʃ'i55"]
+
+
+@pytest.mark.parametrize("jp_str", ["gwong2dung", "hou7"])
+def test_ipa_converter_invalid_input(jp_str):
+    with pytest.raises(ValueError):
+        IPAConverter().convert(jp_str)
+    with pytest.raises(ValueError):
+        IPAConverter().convert_many(["ci1", jp_str])
+
+
+@pytest.mark.parametrize(
+    "ipa_str, expected",
+    [
+        ("kʷɔŋ25 tʊŋ55 waː25", "gwong2dung1waa2"),
+        ("kʷɔŋ25tʊŋ55waː25", "gwong2dung1waa2"),
+        ("kɵk̚33", "geok3"),
+        ("", ""),
+    ],
+)
+def test_ipa_to_jyutping(ipa_str, expected):
+    assert ipa_to_jyutping(ipa_str) == expected
+
+
+def test_ipa_to_jyutping_invalid_input():
+    with pytest.raises(ValueError):
+        ipa_to_jyutping("kʷɔŋ")
+
+
+def test_ipa_to_jyutping_many():
+    jp_strs = ["taa1", "ging6", "gui6", "m4goi1", "syu1"]
+    ipa_strs = [jyutping_to_ipa(jp_str, return_as="string") for jp_str in jp_strs]
+    assert ipa_to_jyutping_many(ipa_strs) == jp_strs
+
+
+def test_ipa_converter_to_jyutping():
+    converter = IPAConverter(onsets={"c": "tʃ'"}, tones={"1": "˥"})
+    assert converter.to_jyutping("tʃ'i˥ faːn22") == "ci1faan6"
+    assert converter.to_jyutping_many(["tʃ'i˥", "kʷɔŋ25tʊŋ˥"]) == ["ci1", "gwong2dung1"]
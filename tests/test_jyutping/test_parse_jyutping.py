@@ -5,9 +5,13 @@ If these tests fail, the documentation should probably be updated as well
 (and the bugs should be fixed, if any).
 """
 
+import copy
+import dataclasses
+import pickle
+
 import pytest
 
-from pycantonese import parse_jyutping
+from pycantonese import parse_jyutping, parse_jyutping_many
 from pycantonese.jyutping.parse_jyutping import Jyutping
 
 
@@ -123,3 +127,52 @@ def test_case_insensitivity():
 )
 def test_syllabic_vowels(input_, expected):
     assert parse_jyutping(input_) == [expected]
+
+
+def test_same_syllable_same_object():
+    first, second = parse_jyutping("si1si1")
+    assert first is second
+    assert first is parse_jyutping("SI1")[0]
+
+
+def test_immutability():
+    jp = parse_jyutping("si1")[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        jp.tone = "2"
+    assert parse_jyutping("si1") == [Jyutping("s", "i", "", "1")]
+
+
+def test_pickle_and_deepcopy():
+    jp = parse_jyutping("gwong2")[0]
+    for copied in (pickle.loads(pickle.dumps(jp)), copy.deepcopy(jp)):
+        assert copied == jp
+        assert hash(copied) == hash(jp)
+        assert str(copied) == "gwong2"
+    assert not hasattr(jp, "__dict__")
+
+
+def test_parse_jyutping_many():
+    jp_strs = ["gwong2dung1waa2", "hou7", "", "M4goi1", None, 123, "gwong2dung", "si1"]
+    parsed = parse_jyutping_many(iter(jp_strs))
+    assert len(parsed) == len(jp_strs)
+    assert list(parsed.offsets) == [0, 3, 3, 3, 5, 5, 5, 5, 6]
+    assert list(parsed.errors) == [0, 1, 0, 0, 0, 1, 1, 0]
+    onsets = [parsed.onset_labels[code] for code in parsed.onsets]
+    assert onsets == ["gw", "d", "w", "", "g", "s"]
+    nuclei = [parsed.nucleus_labels[code] for code in parsed.nuclei]
+    assert nuclei == ["o", "u", "aa", "m", "o", "i"]
+    codas = [parsed.coda_labels[code] for code in parsed.codas]
+    assert codas == ["ng", "ng", "", "", "i", ""]
+    assert list(parsed.tones) == [2, 1, 2, 4, 1, 1]
+    for i, jp_str in enumerate(jp_strs):
+        if parsed.errors[i]:
+            assert parsed.jyutping(i) is None
+        else:
+            assert parsed.jyutping(i) == parse_jyutping(jp_str)
+
+
+def test_parse_jyutping_many_empty():
+    parsed = parse_jyutping_many([])
+    assert len(parsed) == 0
+    assert list(parsed.offsets) == [0]
+    assert not parsed.tones
@@ -1,6 +1,13 @@
+import unicodedata
+
 import pytest
 
-from pycantonese import jyutping_to_yale
+from pycantonese import (
+    jyutping_to_yale,
+    jyutping_to_yale_many,
+    yale_to_jyutping,
+    yale_to_jyutping_many,
+)
 from pycantonese.jyutping.parse_jyutping import ONSETS, NUCLEI, CODAS
 from pycantonese.jyutping.yale import (
     ONSETS_YALE,
@@ -37,3 +44,84 @@ def test_jyutping_to_yale_m4goi1():
 
 def test_jyutping_to_yale_gwong2dung1waa2():
     assert jyutping_to_yale("gwong2dung1waa2") == ["gwóng", "dūng", "wá"]
+
+
+@pytest.mark.parametrize(
+    "input_, expected",
+    [
+        ("hei3hau6", "hei'hauh"),
+        ("sap6at1", "sahp'āt"),
+        ("gwong2dung1waa2", "gwóngdūngwá"),
+        ("GWONG2DUNG1WAA2", "gwóngdūngwá"),
+    ],
+)
+def test_jyutping_to_yale_return_as_string(input_, expected):
+    assert jyutping_to_yale(input_, return_as="string") == expected
+
+
+@pytest.mark.parametrize("input_", ["gwong2dung", "hou7"])
+def test_jyutping_to_yale_invalid_input(input_):
+    with pytest.raises(ValueError):
+        jyutping_to_yale(input_)
+
+
+def test_jyutping_to_yale_many():
+    jp_strs = ["m4goi1", "hei3hau6", ""]
+    assert jyutping_to_yale_many(jp_strs) == [
+        jyutping_to_yale(jp_str) for jp_str in jp_strs
+    ]
+    assert jyutping_to_yale_many(jp_strs, return_as="string") == [
+        "m̀hgōi",
+        "hei'hauh",
+        "",
+    ]
+
+
+def test_jyutping_to_yale_many_invalid_input():
+    with pytest.raises(ValueError):
+        jyutping_to_yale_many(["m4goi1", "hou7"])
+
+
+@pytest.mark.parametrize(
+    "input_, expected",
+    [
+        ("gwóngdūngwá", "gwong2dung1waa2"),
+        ("gwóng dūng wá", "gwong2dung1waa2"),
+        ("Gwóngdūngwá", "gwong2dung1waa2"),
+        ("hei'hauh", "hei3hau6"),
+        ("sahp'āt", "sap6at1"),
+        ("m̀hgōi", "m4goi1"),
+        ("geuk", "goek3"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_yale_to_jyutping(input_, expected):
+    assert yale_to_jyutping(input_) == expected
+
+
+def test_yale_to_jyutping_nfd_input():
+    assert yale_to_jyutping(unicodedata.normalize("NFD", "gwóngdūngwá")) == (
+        "gwong2dung1waa2"
+    )
+
+
+@pytest.mark.parametrize("input_", ["gwóngx", "hello world", 1])
+def test_yale_to_jyutping_invalid_input(input_):
+    with pytest.raises(ValueError):
+        yale_to_jyutping(input_)
+
+
+def test_yale_to_jyutping_round_trip():
+    jp_strs = ["gwong2dung1waa2", "hei3hau6", "sap6at1", "m4goi1", "ngo5dei6"]
+    yale_strs = jyutping_to_yale_many(jp_strs, return_as="string")
+    assert yale_to_jyutping_many(yale_strs) == jp_strs
+
+
+def test_yale_to_jyutping_many():
+    assert yale_to_jyutping_many(["m̀hgōi", "hei'hauh", "m̀hgōi", ""]) == [
+        "m4goi1",
+        "hei3hau6",
+        "m4goi1",
+        "",
+    ]
@@ -1,6 +1,6 @@
 import pytest
 
-from pycantonese import parse_text
+from pycantonese import _parallel, parse_text
 
 
 @pytest.mark.parametrize(
@@ -142,3 +142,16 @@ def test_parse_text(text, pos_tag_kwargs, participant, expected):
     )
     actual = "\n".join(corpus.to_strs())
     assert actual == expected
+
+
+def test_parse_text_parallel():
+    data = ["廣東話好難學？", "都唔係吖！", "學廣東話"] * 50
+    expected = parse_text(data, parallel=False).to_strs()
+    assert parse_text(data, parallel=True).to_strs() == expected
+
+
+def test_parse_text_parallel_spawn(monkeypatch):
+    monkeypatch.setattr(_parallel, "_CAN_FORK", False)
+    data = ["廣東話好難學？", "都唔係吖！", "學廣東話"] * 50
+    expected = parse_text(data, parallel=False).to_strs()
+    assert parse_text(data, parallel=True).to_strs() == expected
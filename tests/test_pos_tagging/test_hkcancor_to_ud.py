@@ -1,6 +1,11 @@
 import pytest
 
-from pycantonese.pos_tagging.hkcancor_to_ud import hkcancor_to_ud, _MAP
+from pycantonese.pos_tagging.hkcancor_to_ud import (
+    TAG_VOCABULARY,
+    hkcancor_to_ud,
+    _MAP,
+    _UD_TABLE,
+)
 
 # # UD 2.0 tagset: https://universaldependencies.org/u/pos/index.html
 _UD_TAGSET = frozenset(
@@ -21,6 +26,10 @@ _UD_TAGSET = frozenset(
 )
 def test_hkcancor_to_ud(tag, expected):
     assert hkcancor_to_ud(tag) == expected
+    # The same mapping, used for many tags at once.
+    assert _UD_TABLE[tag] == expected
+    ud_id = TAG_VOCABULARY._hkcancor_to_ud_ids[tag]
+    assert TAG_VOCABULARY.ud_tags[ud_id] == expected
 
 
 def test_hkcancor_to_ud_all_tags():
@@ -34,3 +43,15 @@ def test_hkcancor_to_ud_map_has_only_ud_tags():
             invalid_pairs.append((hkcancor_tag, ud_tag))
     if invalid_pairs:
         raise ValueError(f"Invalid pairs: {invalid_pairs}")
+
+
+def test_tag_vocabulary():
+    assert set(TAG_VOCABULARY.ud_tags) == _UD_TAGSET
+    assert TAG_VOCABULARY.hkcancor_tags[0] == ""
+    assert set(TAG_VOCABULARY.hkcancor_tags[1:]) == set(_MAP)
+    for i, tag in enumerate(TAG_VOCABULARY.hkcancor_tags):
+        assert TAG_VOCABULARY.hkcancor_id(tag) == i
+        ud_tag = TAG_VOCABULARY.ud_tags[TAG_VOCABULARY.hkcancor_to_ud_ids[i]]
+        assert ud_tag == hkcancor_to_ud(tag)
+    assert TAG_VOCABULARY.hkcancor_id("foobar") == 0
+    assert TAG_VOCABULARY.ud_id("foobar") == TAG_VOCABULARY.ud_id("X")
@@ -1,6 +1,18 @@
 import pytest
 
-from pycantonese import pos_tag
+from pycantonese import pos_tag, pos_tag_many
+from pycantonese.pos_tagging import (
+    TAG_VOCABULARY,
+    pos_tag_cache_clear,
+    pos_tag_cache_info,
+    set_pos_tag_cache,
+)
+from pycantonese.pos_tagging.tagger import (
+    _MODEL_PATH,
+    _MODEL_PATH_ENV_VAR,
+    _POSTagger,
+    _get_tagger,
+)
 
 
 def test_pos_tag():
@@ -21,3 +33,79 @@ def test_pos_tag_wrong_input_type():
 def test_pos_tag_unknown_tagset():
     with pytest.raises(ValueError):
         pos_tag(["我"], tagset="unknown tagset")
+
+
+@pytest.mark.parametrize("tagset", ["universal", "hkcancor"])
+def test_pos_tag_many(tagset):
+    sentences = [["我", "噚日", "買", "嗰", "對", "鞋", "。"], [], ["好", "靚", "！"]]
+    expected = [pos_tag(words, tagset=tagset) for words in sentences]
+    assert pos_tag_many(sentences, tagset) == expected
+    assert pos_tag_many(iter(sentences), tagset, batch_size=1) == expected
+
+
+def test_pos_tag_many_wrong_input_type():
+    with pytest.raises(TypeError):
+        pos_tag_many([["我"], "我"])
+
+
+def test_pos_tag_many_invalid_arguments():
+    with pytest.raises(ValueError):
+        pos_tag_many([["我"]], tagset="unknown tagset")
+    with pytest.raises(ValueError):
+        pos_tag_many([["我"]], batch_size=0)
+
+
+def test_pos_tag_return_ids():
+    words = ["我", "噚日", "買", "嗰", "對", "鞋", "。"]
+    ud_ids = pos_tag(words, return_ids=True)
+    hkcancor_ids = pos_tag(words, tagset="hkcancor", return_ids=True)
+    assert ud_ids.typecode == hkcancor_ids.typecode == "B"
+    assert [TAG_VOCABULARY.ud_tags[i] for i in ud_ids] == [
+        tag for _, tag in pos_tag(words)
+    ]
+    assert [TAG_VOCABULARY.hkcancor_tags[i] for i in hkcancor_ids] == [
+        tag for _, tag in pos_tag(words, tagset="hkcancor")
+    ]
+    assert [TAG_VOCABULARY.hkcancor_to_ud_ids[i] for i in hkcancor_ids] == list(ud_ids)
+    assert pos_tag_many([words, ["好"]], return_ids=True) == [
+        ud_ids,
+        pos_tag(["好"], return_ids=True),
+    ]
+
+
+def test_pos_tag_cache():
+    words = ["我", "噚日", "買", "嗰", "對", "鞋", "。"]
+    assert pos_tag_cache_info() is None
+    set_pos_tag_cache(2)
+    try:
+        expected = pos_tag(words)
+        result = pos_tag(words)
+        assert result == expected
+        result.append("foo")  # Mutating a result doesn't affect the cache.
+        assert pos_tag(words) == expected
+        assert (
+            pos_tag(words, return_ids=True) == pos_tag_many([words], return_ids=True)[0]
+        )
+        info = pos_tag_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+        pos_tag_cache_clear()
+        assert pos_tag_cache_info().currsize == 0
+        pos_tag(words)
+        _get_tagger().load(_MODEL_PATH)  # Reloading the tagger clears the cache.
+        assert pos_tag_cache_info().currsize == 0
+    finally:
+        set_pos_tag_cache(0)
+    assert pos_tag_cache_info() is None
+
+
+def test_model_path_env_var(monkeypatch, tmp_path):
+    path = str(tmp_path / "tagger.fb.zst")
+    tagger = _POSTagger()
+    tagger.fit([["我", "食"]] * 3, [["v", "v"]] * 3)
+    tagger.save(path)
+    monkeypatch.setenv(_MODEL_PATH_ENV_VAR, path)
+    _get_tagger.cache_clear()
+    try:
+        assert pos_tag(["我"], tagset="hkcancor") == [("我", "v")]
+    finally:
+        _get_tagger.cache_clear()
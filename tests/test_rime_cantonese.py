@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from pycantonese.data.rime_cantonese import CHARS_TO_JYUTPING
+from pycantonese.data.rime_cantonese._mapped_dict import (
+    _MappedDict,
+    _write_mapped_dict,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"香港": "hoeng1gong2", "IQ題": "aai1kiu1tai4", "a": ""},
+        {f"字{i}": f"zi{i % 6 + 1}" for i in range(1000)},
+    ],
+)
+def test_mapped_dict_round_trip(tmp_path, data):
+    path = str(tmp_path / "data.bin")
+    _write_mapped_dict(data, path)
+    mapped = _MappedDict(path)
+    assert len(mapped) == len(data)
+    assert list(mapped) == list(data)
+    assert dict(mapped.items()) == data
+    assert mapped == data
+    for key, value in data.items():
+        assert key in mapped
+        assert mapped[key] == value
+    assert "唔喺度" not in mapped
+    assert 1 not in mapped
+    assert mapped.get("唔喺度") is None
+    with pytest.raises(KeyError):
+        mapped["唔喺度"]
+    assert list(mapped._sorted_keys()) == sorted(data)
+
+
+def test_mapped_dict_invalid_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"not a mapped dict file")
+    with pytest.raises(ValueError):
+        _MappedDict(str(path))
+
+
+def test_chars_to_jyutping():
+    assert isinstance(CHARS_TO_JYUTPING, _MappedDict)
+    assert CHARS_TO_JYUTPING["廣東話"] == "gwong2dung1waa2"
+    assert "廣東話" in CHARS_TO_JYUTPING.keys()
+    assert pickle.loads(pickle.dumps(CHARS_TO_JYUTPING))["廣東話"] == "gwong2dung1waa2"
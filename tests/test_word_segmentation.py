@@ -1,6 +1,21 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from pycantonese import segment
+from pycantonese import _parallel, segment, segment_many
+from pycantonese.data.rime_cantonese import CHARS_TO_JYUTPING, MIXED_SCRIPT_WORDS
+from pycantonese.util import _NOT_CANTONESE
+from pycantonese.word_segmentation import (
+    IncrementalSegmenter,
+    add_words,
+    load_user_dict,
+    remove_words,
+    segment_cache_clear,
+    segment_cache_info,
+    set_segment_cache,
+)
+from pycantonese.word_segmentation.segmenter import _get_default_segmenter
 
 
 @pytest.mark.parametrize(
@@ -24,3 +39,202 @@ from pycantonese import segment
 def test_segment(chars, expected):
     actual = segment(chars)
     assert actual == expected
+
+
+def test_segment_many():
+    texts = ["廣東話容唔容易學？", "", "我今晚會have dinner.", "  "]
+    expected = [segment(text) for text in texts]
+    assert segment_many(texts) == expected
+    assert segment_many(iter(texts), batch_size=1) == expected
+
+
+def test_segment_many_offsets():
+    texts = ["廣東 話容唔容 易學？ ", "我今晚會 have dinner"]
+    expected = [segment(text, offsets=True) for text in texts]
+    assert segment_many(texts, offsets=True) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["廣東 話容唔容 易學？ ", "我今晚會 have dinner 定係 go shopping?", "", "  "],
+)
+def test_segment_offsets_array(text):
+    words, starts, ends = segment(text, offsets="array")
+    assert starts.typecode == ends.typecode == "l"
+    assert list(zip(words, zip(starts, ends))) == segment(text, offsets=True)
+
+
+def test_segment_many_offsets_array():
+    texts = ["廣東 話容唔容 易學？ ", "", "我今晚會 have dinner"]
+    expected = [segment(text, offsets="array") for text in texts]
+    assert segment_many(texts, offsets="array") == expected
+
+
+def test_segment_many_invalid_batch_size():
+    with pytest.raises(ValueError):
+        segment_many(["廣東話"], batch_size=0)
+
+
+def test_segment_unseen_alphanum_does_not_grow_pua_mapping():
+    segmenter = _get_default_segmenter()
+    n_pua = len(segmenter._alphanum_to_pua)
+    assert segment("我今晚會 have xyzdinner") == [
+        "我",
+        "今晚",
+        "會",
+        "have",
+        "xyzdinner",
+    ]
+    assert len(segmenter._alphanum_to_pua) == n_pua
+
+
+def test_segment_unseen_alphanum_in_threads():
+    words = [f"xyz{i}" for i in range(100)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda w: segment(f"我今晚會 {w}"), words))
+    assert [result[-1] for result in results] == words
+
+
+def test_segment_cache():
+    assert segment_cache_info() is None
+    set_segment_cache(2)
+    try:
+        expected = segment("廣東話容唔容易學？")
+        result = segment("廣東話容唔容易學？")
+        assert result == expected
+        result.append("foo")  # Mutating a result doesn't affect the cache.
+        assert segment("廣東話容唔容易學？") == expected
+        assert segment("廣東話容唔容易學？", offsets=True)[0] == ("廣東話", (0, 3))
+        info = segment_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+        segment_cache_clear()
+        assert segment_cache_info().currsize == 0
+    finally:
+        set_segment_cache(0)
+    assert segment_cache_info() is None
+
+
+@pytest.mark.parametrize("offsets", [False, True])
+def test_segment_many_n_jobs(offsets):
+    texts = ["廣東話容唔容易學？", "", "我今晚會have dinner."] * 10
+    expected = segment_many(texts, offsets=offsets)
+    assert segment_many(texts, offsets=offsets, batch_size=4, n_jobs=2) == expected
+
+
+def test_segment_many_n_jobs_spawn(monkeypatch):
+    # Workers that aren't forked (e.g., on macOS and Windows) get the
+    # user dictionary without pickling the segmenter.
+    monkeypatch.setattr(_parallel, "_CAN_FORK", False)
+    add_words(["鴨寮街"])
+    try:
+        texts = ["去鴨寮街", "廣東話容唔容易學？"] * 5
+        expected = segment_many(texts)
+        assert segment_many(texts, batch_size=2, n_jobs=2) == expected
+        assert expected[0] == ["去", "鴨寮街"]
+    finally:
+        remove_words(["鴨寮街"])
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2])
+def test_segment_many_invalid_n_jobs(n_jobs):
+    with pytest.raises(ValueError):
+        segment_many(["廣東話"], n_jobs=n_jobs)
+
+
+def test_mixed_script_words_match_chars_to_jyutping():
+    expected = [
+        word
+        for word in CHARS_TO_JYUTPING
+        if any(c in _NOT_CANTONESE for c in word)
+        and any(c not in _NOT_CANTONESE for c in word)
+    ]
+    assert MIXED_SCRIPT_WORDS == sorted(expected)
+
+
+def test_user_dictionary():
+    add_words(["鴨寮街", "IQ題目"])
+    try:
+        assert segment("去鴨寮街") == ["去", "鴨寮街"]
+        assert segment("去鴨寮街", offsets=True)[1] == ("鴨寮街", (1, 4))
+        assert segment_many(["去鴨寮街"], n_jobs=2) == [["去", "鴨寮街"]]
+        assert "IQ題目" in segment("呢條IQ題目好難")
+    finally:
+        remove_words(["鴨寮街", "IQ題目"])
+    assert not _get_default_segmenter()._user_words
+
+
+def test_load_user_dict(tmp_path):
+    path = tmp_path / "user_dict.txt"
+    path.write_text("鴨寮街 3 ns\n\n深水埗\n", encoding="utf8")
+    load_user_dict(path)
+    try:
+        assert segment("深水埗鴨寮街") == ["深水埗", "鴨寮街"]
+    finally:
+        remove_words(["鴨寮街", "深水埗"])
+
+
+@pytest.mark.parametrize(
+    "position, deleted, inserted",
+    [(0, 0, "廣東話"), (3, 2, ""), (8, 0, "我今晚會 have dinner"), (4, 3, "學")],
+)
+def test_incremental_segmenter_edit(position, deleted, inserted):
+    # Without punctuation marks and with enough context,
+    # the whole text is re-segmented.
+    text = "廣東話容唔容易學"
+    segmenter = IncrementalSegmenter(text, context=100)
+    before = segmenter.segment(offsets=True)
+    diff = segmenter.edit(position, deleted, inserted)
+    new_text = text[:position] + inserted + text[position + deleted :]
+    after = segment(new_text, offsets=True)
+    assert segmenter.text == new_text
+    assert segmenter.segment(offsets=True) == after
+    delta = len(inserted) - deleted
+    assert after == (
+        before[: diff.index]
+        + diff.added
+        + [
+            (word, (start + delta, end + delta))
+            for word, (start, end) in before[diff.index + len(diff.removed) :]
+        ]
+    )
+
+
+def test_incremental_segmenter_random_edits():
+    # Punctuation marks and Latin letters, which the model draws on
+    # as context like any other characters.
+    pieces = ["廣東話", "容易", "學", "唔", "晚", "港", "會", "今", "去", "啦", "係"]
+    pieces += ["佢", "人", "茶", "T恤", "abc", "have", "dinner", "-", " ", "\n"]
+    pieces += ["？", "，", "。"]
+    rng = random.Random(42)
+    text = "".join(rng.choices(pieces, k=60))
+    segmenter = IncrementalSegmenter(text)
+    for _ in range(200):
+        position = rng.randint(0, len(text))
+        deleted = rng.randint(0, min(3, len(text) - position))
+        inserted = "".join(rng.choices(pieces, k=rng.randint(0, 2)))
+        segmenter.edit(position, deleted, inserted)
+        text = text[:position] + inserted + text[position + deleted :]
+        assert segmenter.segment(offsets=True) == segment(text, offsets=True)
+
+
+def test_incremental_segmenter_offsets_after_edits():
+    text = "廣東話容唔容易學？我今晚會 have dinner 定係 go shopping？" * 3
+    segmenter = IncrementalSegmenter(text)
+    for position, deleted, inserted in [(20, 0, "你好，"), (3, 4, ""), (60, 2, "啦")]:
+        segmenter.edit(position, deleted, inserted)
+        text = text[:position] + inserted + text[position + deleted :]
+        words, starts, ends = segmenter.segment(offsets="array")
+        assert segmenter.segment() == words
+        assert [text[s:e].replace(" ", "") for s, e in zip(starts, ends)] == words
+    segmenter.set_text(text)
+    assert segmenter.segment(offsets=True) == segment(text, offsets=True)
+
+
+def test_incremental_segmenter_invalid_edit():
+    segmenter = IncrementalSegmenter("廣東話")
+    with pytest.raises(ValueError):
+        segmenter.edit(4, 0, "好")
+    with pytest.raises(ValueError):
+        segmenter.edit(1, 3)
+    with pytest.raises(ValueError):
+        IncrementalSegmenter(context=0)